@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+from collections.abc import Mapping
 from dataclasses import is_dataclass, fields
 from datetime import datetime
 from pathlib import Path
@@ -60,10 +61,11 @@ def _render_type(t: Any) -> str:
     if origin in (list, List):
         inner = _render_type(args[0]) if args else "any"
         return f"List~{inner}~"
-    if origin in (dict, Dict):
+    if origin in (dict, Dict, Mapping):
         key = _render_type(args[0]) if args else "any"
         val = _render_type(args[1]) if len(args) > 1 else "any"
-        return f"Dict~{key},{val}~"
+        name = "Mapping" if origin is Mapping else "Dict"
+        return f"{name}~{key},{val}~"
     if origin is tuple or origin is Tuple:
         inner = ",".join(_render_type(a) for a in args) if args else ""
         return f"Tuple~{inner}~"
@@ -106,7 +108,7 @@ def _field_association_types(anno: Any) -> Iterable[type]:
                 yield a
         return
 
-    if origin in (dict, Dict):
+    if origin in (dict, Dict, Mapping):
         for a in args:
             if inspect.isclass(a) and _is_dataclass_type(a):
                 yield a
@@ -158,21 +158,25 @@ def _local_ramc_from_fraction(anchor_deg: float, fraction: float, sa_deg: float)
 
 
 def _placidus_cusp(anchor_deg: float, fraction: float, eps_rad: float, lat_rad: float) -> float:
+    # Loop invariants: obliquity and latitude do not change between iterations
+    sin_eps = math.sin(eps_rad)
+    cos_eps = math.cos(eps_rad)
+    tan_lat = math.tan(lat_rad)
     lon = anchor_deg
     for _ in range(20):
         lon_rad = math.radians(lon)
-        dec = math.asin(math.sin(eps_rad) * math.sin(lon_rad))
+        dec = math.asin(sin_eps * math.sin(lon_rad))
         cos_dec = math.cos(dec)
         if abs(cos_dec) < 1e-10:
             break
-        cos_sa = -(math.tan(lat_rad) * math.tan(dec))
+        cos_sa = -(tan_lat * math.tan(dec))
         if abs(cos_sa) > 1.0:
             break
         sa = math.degrees(math.acos(cos_sa))
         ramc_cusp = _local_ramc_from_fraction(anchor_deg, fraction, sa)
         ramc_rad = math.radians(ramc_cusp)
         new_lon = math.degrees(
-            math.atan2(math.sin(ramc_rad), math.cos(ramc_rad) * math.cos(eps_rad))
+            math.atan2(math.sin(ramc_rad), math.cos(ramc_rad) * cos_eps)
         )
         new_lon = _normalize_deg(new_lon)
         if abs(new_lon - lon) < 1e-6:
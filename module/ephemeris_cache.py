@@ -0,0 +1,169 @@
+"""
+Precomputed planetary longitude tables for fast transit scans.
+
+Building a table evaluates the JPL ephemeris once on a fixed time grid for one
+location and stores the longitudes with numpy.savez_compressed. Lookups then
+interpolate linearly between grid points instead of running Skyfield; with the
+default 10-minute step the error stays below 0.001° even for the Moon.
+
+Usage:
+    from module.ephemeris_cache import build_cache, load_cache
+    from module.services import set_longitude_table
+
+    build_cache('prague.npz', 2000, 2030, "50.0875, 14.4214", step_minutes=10)
+    set_longitude_table(load_cache('prague.npz'))
+    # compute_jpl_positions now answers in-range queries at that location from the table
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Collection, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from module.logging_config import get_logger
+    from module.utils import Actual, default_ephemeris_path, ensure_aware
+except ImportError:
+    from logging_config import get_logger
+    from utils import Actual, default_ephemeris_path, ensure_aware
+
+logger = get_logger(__name__)
+
+DEGREES_IN_CIRCLE = 360.0
+# Locations are matched at the same precision as the JPL position cache (~10 m)
+_LOCATION_DECIMALS = 4
+
+
+@dataclass(frozen=True, eq=False)
+class LongitudeTable:
+    """Ecliptic longitudes on a regular time grid for one location and ephemeris.
+
+    times: POSIX timestamps (seconds) of the grid points, ascending
+    longitudes: array of shape (len(times), len(planets)), unwrapped per planet so
+        interpolation never crosses the 360° -> 0° seam
+    planets: body ids, one per column of longitudes
+    latitude/longitude: observer location the table was built for
+    ephemeris: file name of the BSP ephemeris used
+
+    Naive datetimes passed to covers() and lookup_longitudes() are taken as UTC.
+    """
+    times: np.ndarray
+    longitudes: np.ndarray
+    planets: Tuple[str, ...]
+    latitude: float
+    longitude: float
+    ephemeris: str
+    # planet -> column of longitudes, built once for lookups
+    _columns: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_columns', {p: j for j, p in enumerate(self.planets)})
+
+    def covers(self, dt: datetime, latitude: float, longitude: float, ephemeris_file: str,
+               planets: Collection[str]) -> bool:
+        """True when a query can be answered from this table."""
+        ts = ensure_aware(dt).timestamp()
+        return (
+            self.times[0] <= ts <= self.times[-1]
+            and round(latitude, _LOCATION_DECIMALS) == self.latitude
+            and round(longitude, _LOCATION_DECIMALS) == self.longitude
+            and Path(ephemeris_file).name == self.ephemeris
+            and all(p in self._columns for p in planets)
+        )
+
+    def lookup_longitudes(self, dt: datetime, planets: Optional[Collection[str]] = None) -> Dict[str, float]:
+        """Interpolate longitudes at ``dt`` for the requested planets."""
+        ts = ensure_aware(dt).timestamp()
+        # Locate the grid cell once and reuse the weight for every column
+        i = int(np.clip(np.searchsorted(self.times, ts, side='right') - 1, 0, len(self.times) - 2))
+        t0, t1 = self.times[i], self.times[i + 1]
+        w = (ts - t0) / (t1 - t0)
+        row = self.longitudes[i] + w * (self.longitudes[i + 1] - self.longitudes[i])
+        wanted = self.planets if planets is None else planets
+        columns = self._columns
+        return {p: float(row[columns[p]] % DEGREES_IN_CIRCLE) for p in wanted if p in columns}
+
+
+def build_cache(path: Union[str, Path], start_year: int, end_year: int, loc_str: str,
+                step_minutes: int = 10, ephemeris_path: Optional[str] = None,
+                requested_objects: Optional[Collection[str]] = None) -> LongitudeTable:
+    """Compute a longitude table for ``[start_year, end_year]`` and save it to ``path``.
+
+    The grid is evaluated one year at a time with compute_jpl_longitudes_batch
+    to bound memory use.
+
+    Args:
+        path: Output .npz file
+        start_year: First year covered (from 1 January 00:00 UTC)
+        end_year: Last year covered (through 1 January of end_year + 1)
+        loc_str: Observer location string (parsed by utils.Actual)
+        step_minutes: Grid spacing in minutes
+        ephemeris_path: Optional path to a local BSP file; falls back to default
+        requested_objects: Optional planet ids; defaults to every JPL-supported body
+
+    Returns:
+        The LongitudeTable that was written
+    """
+    try:
+        from module.services import compute_jpl_longitudes_batch
+    except ImportError:
+        from services import compute_jpl_longitudes_batch
+
+    eph_file = ephemeris_path or default_ephemeris_path()
+    place = Actual(loc_str, t="loc")
+    step = timedelta(minutes=step_minutes)
+    end = datetime(end_year + 1, 1, 1, tzinfo=timezone.utc)
+
+    planets: Tuple[str, ...] = ()
+    time_chunks, lon_chunks = [], []
+    for year in range(start_year, end_year + 1):
+        chunk_start = datetime(year, 1, 1, tzinfo=timezone.utc)
+        chunk_end = min(datetime(year + 1, 1, 1, tzinfo=timezone.utc), end)
+        count = int((chunk_end - chunk_start) / step)
+        # The final chunk also includes its end point so the table covers it
+        if chunk_end == end:
+            count += 1
+        dts = [chunk_start + k * step for k in range(count)]
+        lons = compute_jpl_longitudes_batch(dts, loc_str, eph_file, requested_objects)
+        if not lons:
+            raise RuntimeError("JPL ephemeris is unavailable; cannot build a longitude table")
+        planets = tuple(lons)
+        time_chunks.append(np.array([dt.timestamp() for dt in dts]))
+        lon_chunks.append(np.column_stack([lons[p] for p in planets]))
+        logger.info("Longitude table: computed %d samples for %d", count, year)
+
+    times = np.concatenate(time_chunks)
+    longitudes = np.unwrap(np.concatenate(lon_chunks), period=DEGREES_IN_CIRCLE, axis=0)
+    table = LongitudeTable(
+        times=times,
+        longitudes=longitudes,
+        planets=planets,
+        latitude=round(place.value.latitude, _LOCATION_DECIMALS),
+        longitude=round(place.value.longitude, _LOCATION_DECIMALS),
+        ephemeris=Path(eph_file).name,
+    )
+    np.savez_compressed(
+        path,
+        times=table.times,
+        longitudes=table.longitudes,
+        planets=np.array(table.planets),
+        location=np.array([table.latitude, table.longitude]),
+        ephemeris=np.array(table.ephemeris),
+    )
+    return table
+
+
+def load_cache(path: Union[str, Path]) -> LongitudeTable:
+    """Load a LongitudeTable written by build_cache."""
+    with np.load(path) as data:
+        latitude, longitude = (float(v) for v in data['location'])
+        return LongitudeTable(
+            times=data['times'],
+            longitudes=data['longitudes'],
+            planets=tuple(str(p) for p in data['planets']),
+            latitude=latitude,
+            longitude=longitude,
+            ephemeris=str(data['ephemeris']),
+        )
@@ -1,11 +1,48 @@
 # Model defintions, data structures
 
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional, List, Dict
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Optional, List, Dict, Mapping
 from enum import Enum
 
 
+# ─── HELPERS ───
+
+def _frozen_mapping(value: Optional[Mapping]) -> Optional[Mapping]:
+    """Return a read-only view of `value` so definitions can share it safely.
+
+    Existing proxies are reused as-is; plain dicts are copied once and wrapped.
+    """
+    if value is None or isinstance(value, MappingProxyType):
+        return value
+    return MappingProxyType(dict(value))
+
+
+def _reduce_with_plain_mappings(self):
+    """__reduce__ for dataclasses holding read-only mappings.
+
+    mappingproxy itself cannot be pickled or deep-copied, so rebuild the instance
+    from plain dicts; __post_init__ wraps them again.
+    """
+    values = (getattr(self, f.name) for f in fields(self))
+    return self.__class__, tuple(dict(v) if isinstance(v, MappingProxyType) else v for v in values)
+
+
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_epoch_ns(value: object) -> Optional[int]:
+    """Convert an aware datetime to integer nanoseconds since the Unix epoch (UTC).
+
+    Returns None for naive datetimes (their UTC instant is unknown) and non-datetime values.
+    """
+    if not isinstance(value, datetime) or value.utcoffset() is None:
+        return None
+    delta = value - _EPOCH_UTC
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
 # ─── ENUMS ───
 
 class ChartMode(str, Enum):
@@ -113,7 +150,7 @@ class TimeSystem(str, Enum):
 
 # ─── VALUE OBJECTS ───
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     name: str
     latitude: float
@@ -126,10 +163,16 @@ class DateRange:
     start: datetime
     end: datetime
 
+    def __post_init__(self) -> None:
+        # Integer bounds for cheap scalar/vectorized range checks (not serialized);
+        # None unless the bound is an aware datetime
+        object.__setattr__(self, "start_ns", to_epoch_ns(self.start))
+        object.__setattr__(self, "end_ns", to_epoch_ns(self.end))
+
 
 # ─── CORE ENTITIES ───
 
-@dataclass
+@dataclass(slots=True)
 class ChartSubject:
     id: str
     name: str
@@ -210,7 +253,8 @@ class BodyDefinition:
     element: Optional[Element]  # Use Element enum instead of string
     avg_speed: float
     max_orb: float
-    i18n: Dict[str, str]
+    # Read-only: wrapped in a mappingproxy so definitions can share it
+    i18n: Mapping[str, str]
     # Observable object metadata
     object_type: Optional[ObjectType] = None
     # Mapping of engine type to computation method/attribute name
@@ -222,6 +266,11 @@ class BodyDefinition:
     # Whether this object requires house system (for houses, some angles)
     requires_house_system: bool = False
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "i18n", _frozen_mapping(self.i18n))
+
+    __reduce__ = _reduce_with_plain_mappings
+
 
 @dataclass(frozen=True)
 class AspectDefinition:
@@ -229,7 +278,8 @@ class AspectDefinition:
     glyph: str
     angle: float
     default_orb: float
-    i18n: Dict[str, str]
+    # Read-only: wrapped in a mappingproxy so definitions can share it
+    i18n: Mapping[str, str]
     # Display and importance settings
     color: Optional[str] = None  # Hex color code (e.g., "#FF0000")
     importance: Optional[int] = None  # 1-10 scale, higher = more important
@@ -240,6 +290,11 @@ class AspectDefinition:
     # If None or empty, aspect is valid for all contexts
     valid_contexts: Optional[List[AspectContext]] = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "i18n", _frozen_mapping(self.i18n))
+
+    __reduce__ = _reduce_with_plain_mappings
+
 
 @dataclass(frozen=True)
 class Sign:
@@ -247,7 +302,13 @@ class Sign:
     glyph: str
     abbreviation: str
     element: Element  # Use Element enum instead of string
-    i18n: Dict[str, str]
+    # Read-only: wrapped in a mappingproxy so definitions can share it
+    i18n: Mapping[str, str]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "i18n", _frozen_mapping(self.i18n))
+
+    __reduce__ = _reduce_with_plain_mappings
 
 
 @dataclass
@@ -289,9 +350,15 @@ class OverrideEntry:
     angle: Optional[float] = None
     default_orb: Optional[float] = None
     only_for: Optional[List[str]] = None
-    i18n: Optional[Dict[str, str]] = None
+    # Read-only: wrapped in a mappingproxy so merged definitions can share it
+    i18n: Optional[Mapping[str, str]] = None
     computed: Optional[bool] = None
 
+    def __post_init__(self) -> None:
+        self.i18n = _frozen_mapping(self.i18n)
+
+    __reduce__ = _reduce_with_plain_mappings
+
 
 @dataclass
 class ModelOverrides:
@@ -1,10 +1,18 @@
-from copy import deepcopy
+from collections import OrderedDict
+from copy import copy
+from dataclasses import replace
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from types import MappingProxyType
+from operator import attrgetter
+from typing import Callable, Collection, Dict, Iterator, List, Mapping, NamedTuple, Optional, Any, Sequence, Tuple, Union, get_args
 from datetime import datetime
 import math
 import sys
 import logging
+import warnings
+import numpy as np
 
 # Modern logging setup
 try:
@@ -18,13 +26,13 @@ logger = get_logger(__name__)
 try:
     from module.models import (
         Aspect, AspectDefinition, AstroModel, BodyDefinition, CelestialBody, ChartMode, DateRange,
-        EngineType, ChartConfig, ChartInstance, Location, ModelOverrides, ModelSettings, Sign,
+        EngineType, ChartConfig, ChartInstance, Location, ModelOverrides, ModelSettings, OverrideEntry, Sign,
         ObjectType, Workspace
     )
 except ImportError:
     from models import (
         Aspect, AspectDefinition, AstroModel, BodyDefinition, CelestialBody, ChartMode, DateRange,
-        EngineType, ChartConfig, ChartInstance, Location, ModelOverrides, ModelSettings, Sign,
+        EngineType, ChartConfig, ChartInstance, Location, ModelOverrides, ModelSettings, OverrideEntry, Sign,
         ObjectType, Workspace
     )
 
@@ -34,9 +42,9 @@ except ImportError:
     from astronomy import ChartData, backend_for_chart
 
 try:
-    from module.utils import Actual, default_ephemeris_path, ensure_aware, prepare_horoscope, compute_vernal_equinox_offset, _safe_get_attr, to_timezone
+    from module.utils import Actual, _parse_date_string, default_ephemeris_path, ensure_aware, prepare_horoscope, compute_vernal_equinox_offset, _safe_get_attr, to_timezone
 except ImportError:
-    from utils import Actual, default_ephemeris_path, ensure_aware, prepare_horoscope, compute_vernal_equinox_offset, _safe_get_attr, to_timezone
+    from utils import Actual, _parse_date_string, default_ephemeris_path, ensure_aware, prepare_horoscope, compute_vernal_equinox_offset, _safe_get_attr, to_timezone
 
 from kerykeion import AstrologicalSubject, KerykeionChartSVG
 try:
@@ -64,6 +72,11 @@ except ImportError:
         Report = None
 from pandas import DataFrame
 
+try:
+    import plotly.graph_objects as go
+except ImportError:
+    go = None
+
 try:
     from skyfield.api import load, load_file, Topos
     JPL = True
@@ -71,77 +84,239 @@ except ImportError:
     JPL = False
     logger.warning("NASA JPL Ephemeris deactivated")
 
+try:
+    from numba import njit
+    NUMBA = True
+except ImportError:
+    NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # Module-level fallback constants (used when model is not available)
 # These match ModelSettings defaults and can be overridden by model settings
 DEGREES_IN_CIRCLE = 360.0  # Full circle in degrees
 OBLIQUITY_J2000_DEGREES = 23.4392911  # J2000.0 obliquity of the ecliptic in degrees
 COORDINATE_TOLERANCE = 0.0001  # Coordinate comparison tolerance
+_SIN_OBL_J2000 = math.sin(math.radians(OBLIQUITY_J2000_DEGREES))
+_COS_OBL_J2000 = math.cos(math.radians(OBLIQUITY_J2000_DEGREES))
+
+# simple in-process caches so repeated JPL queries skip timescale/BSP loading
+_TIMESCALE = None
+_EPH_CACHE: Dict[str, Any] = {}
+_VERNAL_OFFSET_CACHE: Dict[tuple, float] = {}
+_BODY_HANDLES_CACHE: Dict[tuple, Tuple[Any, Mapping[str, Any]]] = {}
+# Optional precomputed longitude table (module.ephemeris_cache), see set_longitude_table
+_LONGITUDE_TABLE = None
+
+
+_JPL_POSITION_CACHE_SIZE = 4096
+_POSITIONS_CACHE_SIZE = 1024
+_POSITIONS_CACHE: "OrderedDict[tuple, Dict[str, Union[float, Dict[str, float]]]]" = OrderedDict()
+_ASPECT_ORBS_CACHE_SIZE = 64
+_ASPECT_ORBS_CACHE: "OrderedDict[int, Tuple[tuple, Mapping[str, float]]]" = OrderedDict()
+_EFFECTIVE_DEFAULTS_CACHE_SIZE = 64
+_CHART_VIEW_CACHE_SIZE = 4096
+_CHART_INDEX_CACHE_SIZE = 16
+_CHART_INDEX_CACHE: "OrderedDict[int, Tuple[list, Dict[str, int]]]" = OrderedDict()
+_CHART_VIEW_CACHE: "OrderedDict[int, Tuple[tuple, Tuple[str, str, str, str, str], str, str]]" = OrderedDict()
+_EFFECTIVE_DEFAULTS_CACHE: "OrderedDict[tuple, Tuple[tuple, Dict[str, object]]]" = OrderedDict()
+_EFFECTIVE_MODEL_CACHE_SIZE = 32
+_EFFECTIVE_MODEL_CACHE: "OrderedDict[int, Tuple[AstroModel, ModelOverrides, tuple, AstroModel]]" = OrderedDict()
+_JPL_POSITION_CACHE: "OrderedDict[tuple, Dict[str, Union[float, Dict[str, float]]]]" = OrderedDict()
+
+
+def _cache_time_bucket(dt_aware: datetime, planets: Collection[str], topocentric: bool = False) -> int:
+    """Quantise a timestamp for the JPL position cache key (POSIX seconds, window start).
+    
+    The window is set by the fastest requested body (the Moon: 1 s, inner
+    planets and the Sun: 10 s, outer planets: 60 s). Topocentric altitude and
+    azimuth change with Earth's rotation, so they always use 1 s. Positions are
+    computed at the returned instant, so every query in a window gets the same result.
+    """
+    step = 1 if topocentric else min((_CACHE_TIME_GRANULARITY_S.get(p, 1) for p in planets), default=1)
+    seconds = int(dt_aware.timestamp())
+    return seconds - seconds % step
+
+
+def _copy_positions(positions: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached positions dict so callers cannot mutate the cache entry."""
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in positions.items()}
+
+
+def _get_timescale():
+    """Return the shared Skyfield timescale, loading it on first use."""
+    global _TIMESCALE
+    if _TIMESCALE is None:
+        _TIMESCALE = load.timescale()
+    return _TIMESCALE
+
+
+def _get_ephemeris(path: str):
+    """Return the Skyfield ephemeris for a BSP path, loading each file only once."""
+    eph = _EPH_CACHE.get(path)
+    if eph is None:
+        eph = load_file(path)
+        _EPH_CACHE[path] = eph
+    return eph
+
+
+def set_longitude_table(table: Optional[Any]) -> None:
+    """Install (or with None, remove) a precomputed ephemeris_cache.LongitudeTable.
+    
+    While installed, longitude-only compute_jpl_positions queries inside the
+    table's time range, location and ephemeris are interpolated from it instead
+    of evaluated with Skyfield.
+    """
+    global _LONGITUDE_TABLE
+    _LONGITUDE_TABLE = table
+    _JPL_POSITION_CACHE.clear()
+    _POSITIONS_CACHE.clear()
+
+
+def _get_vernal_equinox_offset(eph_file: str, year: int, eph, observer, ts) -> float:
+    """Return the vernal-equinox offset for an ephemeris and year, computing it once.
+    
+    The offset depends on the ephemeris and year only (observer parallax is
+    below an arcsecond), so it is cached per pair.
+    """
+    key = (eph_file, year)
+    offset = _VERNAL_OFFSET_CACHE.get(key)
+    if offset is None:
+        offset = compute_vernal_equinox_offset(year, eph, observer, ts)
+        _VERNAL_OFFSET_CACHE[key] = offset
+    return offset
 
 
 # ─────────────────────
 # 🗺️ COMPUTATION MAPPING SYSTEM
 # ─────────────────────
 
-def _get_kerykeion_object_mapping() -> Dict[str, str]:
-    """Map object IDs to kerykeion AstrologicalSubject attribute names.
+# Object ID -> kerykeion attribute name. Built once and shared read-only.
+_KERYKEION_OBJECT_MAPPING: Mapping[str, str] = MappingProxyType({
+    # Planets (standard)
+    "sun": "sun",
+    "moon": "moon",
+    "mercury": "mercury",
+    "venus": "venus",
+    "mars": "mars",
+    "jupiter": "jupiter",
+    "saturn": "saturn",
+    "uranus": "uranus",
+    "neptune": "neptune",
+    "pluto": "pluto",
+    # Angles
+    "asc": "asc",
+    "ascendant": "asc",
+    "desc": "desc",
+    "descendant": "desc",
+    "mc": "mc",
+    "midheaven": "mc",
+    "medium_coeli": "mc",
+    "ic": "ic",
+    "imum_coeli": "ic",
+    # Lunar nodes (v4 legacy names + v5 names)
+    "north_node": "north_node",
+    "south_node": "south_node",
+    "true_north_node": "true_north_node",
+    "true_south_node": "true_south_node",
+    "mean_north_lunar_node": "north_node",
+    "true_north_lunar_node": "true_north_node",
+    "mean_south_lunar_node": "south_node",
+    "true_south_lunar_node": "true_south_node",
+    # Calculated points
+    "lilith": "lilith",
+    "black_moon_lilith": "lilith",
+    "mean_lilith": "lilith",
+    "true_lilith": "true_lilith",
+    "chiron": "chiron",
+    "ceres": "ceres",
+    "pallas": "pallas",
+    "juno": "juno",
+    "vesta": "vesta",
+    # Houses (will be handled separately via houses_list)
+    "house_1": "house_1",
+    "house_2": "house_2",
+    "house_3": "house_3",
+    "house_4": "house_4",
+    "house_5": "house_5",
+    "house_6": "house_6",
+    "house_7": "house_7",
+    "house_8": "house_8",
+    "house_9": "house_9",
+    "house_10": "house_10",
+    "house_11": "house_11",
+    "house_12": "house_12",
+})
+
+# Attribute names probed on kerykeion subjects and point models
+_LON_KEYS = ("ecliptic_longitude", "longitude", "lon", "degree", "deg")
+_PLANET_ATTRS = ('sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto')
+# Bodies the JPL/Skyfield engine can compute; outer planets may need barycenters
+_JPL_SUPPORTED: Tuple[str, ...] = ("sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto")
+_JPL_SUPPORTED_SET = frozenset(_JPL_SUPPORTED)
+_OUTER_PLANETS = frozenset({"jupiter", "saturn", "uranus", "neptune", "pluto"})
+# Seconds a JPL position cache entry may span per body. Positions are evaluated
+# at the start of the window, so a result can lag the query by up to one window
+# of motion: ~1.7e-4° for the Moon (1 s), ~2.5e-4° for Mercury and ~1.1e-4° for
+# the Sun (10 s), ~1.7e-4° for Jupiter (60 s) - all under one arcsecond
+_CACHE_TIME_GRANULARITY_S: Mapping[str, int] = MappingProxyType({
+    "moon": 1,
+    "sun": 10, "mercury": 10, "venus": 10, "mars": 10,
+    "jupiter": 60, "saturn": 60, "uranus": 60, "neptune": 60, "pluto": 60,
+})
+# Date inputs that Actual resolves against the current time
+_VOLATILE_DATE_STRINGS = frozenset({"", "now", "today", "yesterday", "tomorrow"})
+
+
+def _is_fixed_time(value: Any) -> bool:
+    """True when a time input always resolves to the same instant (safe as a cache key).
     
-    Returns a dict mapping object_id -> attribute_name for kerykeion extraction.
+    Datetimes are fixed; strings are fixed unless relative or empty ("now", "today", "").
     """
-    return {
-        # Planets (standard)
-        "sun": "sun",
-        "moon": "moon",
-        "mercury": "mercury",
-        "venus": "venus",
-        "mars": "mars",
-        "jupiter": "jupiter",
-        "saturn": "saturn",
-        "uranus": "uranus",
-        "neptune": "neptune",
-        "pluto": "pluto",
-        # Angles
-        "asc": "asc",
-        "ascendant": "asc",
-        "desc": "desc",
-        "descendant": "desc",
-        "mc": "mc",
-        "midheaven": "mc",
-        "medium_coeli": "mc",
-        "ic": "ic",
-        "imum_coeli": "ic",
-        # Lunar nodes (v4 legacy names + v5 names)
-        "north_node": "north_node",
-        "south_node": "south_node",
-        "true_north_node": "true_north_node",
-        "true_south_node": "true_south_node",
-        "mean_north_lunar_node": "north_node",
-        "true_north_lunar_node": "true_north_node",
-        "mean_south_lunar_node": "south_node",
-        "true_south_lunar_node": "true_south_node",
-        # Calculated points
-        "lilith": "lilith",
-        "black_moon_lilith": "lilith",
-        "mean_lilith": "lilith",
-        "true_lilith": "true_lilith",
-        "chiron": "chiron",
-        "ceres": "ceres",
-        "pallas": "pallas",
-        "juno": "juno",
-        "vesta": "vesta",
-        # Houses (will be handled separately via houses_list)
-        "house_1": "house_1",
-        "house_2": "house_2",
-        "house_3": "house_3",
-        "house_4": "house_4",
-        "house_5": "house_5",
-        "house_6": "house_6",
-        "house_7": "house_7",
-        "house_8": "house_8",
-        "house_9": "house_9",
-        "house_10": "house_10",
-        "house_11": "house_11",
-        "house_12": "house_12",
+    if isinstance(value, datetime):
+        return True
+    return isinstance(value, str) and value.strip().lower() not in _VOLATILE_DATE_STRINGS
+
+
+@lru_cache(maxsize=256)
+def _parse_place_cached(loc_str: str) -> Actual:
+    """Actual(loc_str, t="loc") memoised on the exact string (shared; treat as read-only)."""
+    return Actual(loc_str, t="loc")
+
+
+def _parse_place(loc_str: Any) -> Actual:
+    """Resolve a location input, reusing earlier geocoding and timezone lookups of the same string."""
+    if not isinstance(loc_str, str):
+        return Actual(loc_str, t="loc")
+    return _parse_place_cached(loc_str)
+
+
+_HOUSE_ATTRS = ('first_house', 'second_house', 'third_house', 'fourth_house',
+                'fifth_house', 'sixth_house', 'seventh_house', 'eighth_house',
+                'ninth_house', 'tenth_house', 'eleventh_house', 'twelfth_house')
+
+# Every subject attribute that may hold a KerykeionPointModel. Sorted so the
+# extraction order matches the previous dir() scan.
+_KERYKEION_POINT_ATTRS = tuple(sorted(
+    set(_KERYKEION_OBJECT_MAPPING) | set(_KERYKEION_OBJECT_MAPPING.values()) | set(_HOUSE_ATTRS) | {
+        # Kerykeion v5 optional points (populated when listed in active_points)
+        "earth", "pholus", "eris", "sedna", "haumea", "makemake", "ixion", "orcus", "quaoar",
+        "regulus", "spica", "pars_fortunae", "pars_spiritus", "pars_amoris", "pars_fidei",
+        "vertex", "anti_vertex",
     }
+))
+
+
+def _get_kerykeion_object_mapping() -> Mapping[str, str]:
+    """Map object IDs to kerykeion AstrologicalSubject attribute names.
+    
+    Returns a read-only mapping of object_id -> attribute_name for kerykeion extraction.
+    """
+    return _KERYKEION_OBJECT_MAPPING
 
 
 def _normalize_kerykeion_zodiac(zodiac: Optional[str]) -> str:
@@ -171,16 +346,43 @@ def _build_kerykeion_subject(name: str, time: Actual, place: Actual, zodiac: Opt
         except Exception as e:
             logger.debug("Could not convert subject time to timezone %s: %s", tz_str, e)
 
+    return _construct_kerykeion_subject(
+        name,
+        localized_time.year,
+        localized_time.month,
+        localized_time.day,
+        localized_time.hour,
+        localized_time.minute,
+        localized_time.second,
+        lng,
+        lat,
+        tz_str,
+        city,
+        zodiac_type,
+        online,
+    )
+
+
+@lru_cache(maxsize=256)
+def _construct_kerykeion_subject(name: str, year: int, month: int, day: int, hour: int, minute: int,
+                                 second: int, lng: Optional[float], lat: Optional[float],
+                                 tz_str: Optional[str], city: str, zodiac_type: str, online: bool) -> Any:
+    """Run the Kerykeion constructor, memoised on its primitive inputs.
+    
+    Re-rendering the same chart (or the same natal subject against several
+    transits) reuses the computed subject instead of recomputing it. Callers
+    must treat the returned subject as read-only.
+    """
     if AstrologicalSubjectFactory is not None:
         try:
             return AstrologicalSubjectFactory.from_birth_data(
                 name=name,
-                year=localized_time.year,
-                month=localized_time.month,
-                day=localized_time.day,
-                hour=localized_time.hour,
-                minute=localized_time.minute,
-                seconds=localized_time.second,
+                year=year,
+                month=month,
+                day=day,
+                hour=hour,
+                minute=minute,
+                seconds=second,
                 city=city or None,
                 nation="GB",
                 lng=lng,
@@ -195,11 +397,11 @@ def _build_kerykeion_subject(name: str, time: Actual, place: Actual, zodiac: Opt
 
     return AstrologicalSubject(
         name,
-        localized_time.year,
-        localized_time.month,
-        localized_time.day,
-        localized_time.hour,
-        localized_time.minute,
+        year,
+        month,
+        day,
+        hour,
+        minute,
         lng=lng if lng is not None else 0.0,
         lat=lat if lat is not None else 0.0,
         tz_str=tz_str,
@@ -232,15 +434,58 @@ def _get_kerykeion_calc_point_names(subj: Any) -> List[str]:
     return calc_points
 
 
-def _extract_kerykeion_observable_objects(subj: AstrologicalSubject, requested_objects: Optional[List[str]] = None, model: Optional[AstroModel] = None) -> Dict[str, float]:
+def _point_longitude(point: Any) -> Any:
+    """Read a raw longitude from a Kerykeion point in a single __dict__ walk.
+    
+    Prefers abs_pos, then sign_num * 30 + position (position is relative to the
+    sign), then position, then the standard longitude keys. Plain dicts are read
+    directly; attribute access is only tried for objects without a matching key.
+    
+    Returns:
+        The raw longitude value (not yet normalized), or None if not found
+    """
+    pd = getattr(point, '__dict__', None) or (point if isinstance(point, dict) else {})
+    lon_val = pd.get('abs_pos')
+    if lon_val is None and 'position' in pd:
+        lon_val = pd['position']
+        if 'sign_num' in pd:
+            try:
+                lon_val = float(pd['sign_num']) * 30.0 + float(lon_val)
+            except (ValueError, TypeError):
+                pass
+    if lon_val is None:
+        lon_val = next((pd[k] for k in _LON_KEYS if k in pd), None)
+    if lon_val is None and not isinstance(point, dict):
+        # Properties and other non-__dict__ attributes, one getattr per key
+        lon_val = next((v for v in (getattr(point, k, None) for k in _LON_KEYS) if v is not None), None)
+    return lon_val
+
+
+@njit(cache=True)
+def _normalize_longitudes(lons: np.ndarray, degrees_in_circle: float) -> np.ndarray:
+    """Wrap an array of longitudes into [0, degrees_in_circle).
+    
+    Compiled with numba when it is installed.
+    """
+    return np.mod(lons, degrees_in_circle)
+
+
+def _extract_kerykeion_observable_objects(subj: AstrologicalSubject, requested_objects: Optional[Collection[str]] = None, model: Optional[AstroModel] = None) -> Dict[str, float]:
     """Extract all observable objects from a kerykeion AstrologicalSubject.
     
     Includes planets, angles, houses, lunar nodes, and calculated points.
     Returns a dict mapping object_id -> ecliptic_longitude (degrees).
     """
     positions: Dict[str, float] = {}
-    mapping = _get_kerykeion_object_mapping()
-    lon_keys = ("ecliptic_longitude", "longitude", "lon", "degree", "deg")
+    mapping = _KERYKEION_OBJECT_MAPPING
+    # Per-attribute diagnostics are skipped entirely unless DEBUG is enabled
+    debug = logger.isEnabledFor(logging.DEBUG)
+    # Membership is tested for every probed attribute, so use a set
+    req = frozenset(requested_objects) if requested_objects else None
+    # Raw Kerykeion names accepted by the filter: the requested ids themselves
+    # plus every alias whose canonical id was requested
+    accepted_raw = (req | {raw for raw, canon in mapping.items() if canon in req}) if req is not None else None
+    # Each pass below returns early once every requested id has a position
     
     # Get degrees_in_circle from model settings or use default
     if model and hasattr(model, 'settings') and hasattr(model.settings, 'degrees_in_circle'):
@@ -255,59 +500,94 @@ def _extract_kerykeion_observable_objects(subj: AstrologicalSubject, requested_o
             planets_list = subj.planets_list
             planets_degrees = subj.planets_degrees_ut
             if isinstance(planets_list, list) and isinstance(planets_degrees, list) and len(planets_list) == len(planets_degrees):
-                for i, planet_info in enumerate(planets_list):
-                    if i < len(planets_degrees):
-                        if isinstance(planet_info, dict):
-                            planet_name = planet_info.get('name', '').strip().lower()
-                        else:
-                            planet_name = str(planet_info).strip().lower() if planet_info else ''
-                        
-                        if planet_name:
-                            obj_id = mapping.get(planet_name, planet_name)
-                            if requested_objects and obj_id not in requested_objects and planet_name not in requested_objects:
-                                continue
-                            try:
-                                # Normalize to [0, 360) range (same as JPL)
-                                lon_float = float(planets_degrees[i])
-                                normalized_lon = lon_float % degrees_in_circle
-                                if normalized_lon < 0:
-                                    normalized_lon += degrees_in_circle
-                                positions[obj_id] = normalized_lon
-                            except (ValueError, TypeError, IndexError) as e:
-                                logger.debug("Failed to extract position for %s from planets_degrees_ut: %s", planet_name, e)
-                                continue
+                # Filter first, then normalize all surviving degrees in one batch
+                obj_ids: List[str] = []
+                raw_degrees: List[Any] = []
+                for planet_info, degree in zip(planets_list, planets_degrees):
+                    if isinstance(planet_info, dict):
+                        planet_name = planet_info.get('name', '').strip().lower()
+                    else:
+                        planet_name = str(planet_info).strip().lower() if planet_info else ''
+                    
+                    if planet_name:
+                        if accepted_raw is not None and planet_name not in accepted_raw:
+                            continue
+                        obj_ids.append(mapping.get(planet_name, planet_name))
+                        raw_degrees.append(degree)
+                try:
+                    # Normalize to [0, 360) range (same as JPL)
+                    lons = _normalize_longitudes(np.asarray(raw_degrees, dtype=np.float64), float(degrees_in_circle))
+                    positions.update(zip(obj_ids, lons.tolist()))
+                except (ValueError, TypeError):
+                    # Some entry is not numeric: normalize one by one and skip the bad ones
+                    for obj_id, degree in zip(obj_ids, raw_degrees):
+                        try:
+                            positions[obj_id] = float(degree) % degrees_in_circle
+                        except (ValueError, TypeError) as e:
+                            logger.debug("Failed to extract position for %s from planets_degrees_ut: %s", obj_id, e)
                 if positions:
                     logger.debug("Successfully extracted %d positions from planets_list/planets_degrees_ut", len(positions))
         except (AttributeError, KeyError, TypeError, ValueError) as e:
             logger.debug("Failed to extract from planets_list/planets_degrees_ut: %s", e, exc_info=True)
+    planets_list_found = bool(positions)
+    
+    if req is not None and req <= positions.keys():
+        return positions
+    
+    # Extract houses from houses_list if available (cheap, so run it before the attribute probes)
+    if hasattr(subj, 'houses_list') and isinstance(subj.houses_list, list):
+        for i, house_info in enumerate(subj.houses_list, 1):
+            house_id = f"house_{i}"
+            if req is not None and house_id not in req:
+                continue
+            try:
+                if isinstance(house_info, dict):
+                    # Try different possible keys
+                    degree = (house_info.get('longitude') or 
+                             house_info.get('lon') or 
+                             house_info.get('degree') or
+                             house_info.get('cusp'))
+                    if degree is not None:
+                        # Normalize to [0, 360) range (same as JPL)
+                        lon_float = float(degree)
+                        normalized_lon = lon_float % degrees_in_circle
+                        positions[house_id] = normalized_lon
+                elif hasattr(house_info, 'longitude'):
+                    # Normalize to [0, 360) range (same as JPL)
+                    lon_float = float(house_info.longitude)
+                    normalized_lon = lon_float % degrees_in_circle
+                    positions[house_id] = normalized_lon
+            except (ValueError, TypeError, AttributeError):
+                continue
+    
+    if req is not None and req <= positions.keys():
+        return positions
     
     # If planets_list method didn't work, try direct planet attributes (newer Kerykeion versions)
     # Newer versions store planets as direct attributes (subj.sun, subj.moon, etc.)
     # Also try if they're simple numeric values (float) rather than objects
-    if not positions:
+    if not planets_list_found:
         logger.debug("planets_list not available, trying direct planet attributes (newer Kerykeion API)")
         # Try direct numeric attributes first (simplest case)
-        planet_attrs = ['sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto']
+        planet_attrs = _PLANET_ATTRS
         for planet_name in planet_attrs:
-            if hasattr(subj, planet_name):
-                try:
-                    planet_val = getattr(subj, planet_name)
+            planet_val = getattr(subj, planet_name, None)
+            if planet_val is not None:
+                if debug:
                     logger.debug("  Checking %s: type=%s, value=%s", planet_name, type(planet_val).__name__, planet_val)
-                    # If it's a direct numeric value (float/int), use it
-                    if isinstance(planet_val, (int, float)):
-                        obj_id = mapping.get(planet_name, planet_name)
-                        if requested_objects and obj_id not in requested_objects and planet_name not in requested_objects:
+                # If it's a direct numeric value (float/int), use it
+                if isinstance(planet_val, (int, float)):
+                    obj_id = mapping.get(planet_name, planet_name)
+                    if accepted_raw is not None and planet_name not in accepted_raw:
+                        if debug:
                             logger.debug("  Skipping %s (not in requested_objects)", planet_name)
-                            continue
-                        normalized_lon = float(planet_val) % degrees_in_circle
-                        if normalized_lon < 0:
-                            normalized_lon += degrees_in_circle
-                        positions[obj_id] = normalized_lon
+                        continue
+                    normalized_lon = float(planet_val) % degrees_in_circle
+                    positions[obj_id] = normalized_lon
+                    if debug:
                         logger.debug("  ✓ Extracted %s as direct numeric value: %s", planet_name, normalized_lon)
-                    else:
-                        logger.debug("  %s is not numeric (type: %s), will try as object later", planet_name, type(planet_val).__name__)
-                except (ValueError, TypeError, AttributeError) as e:
-                    logger.debug("  Failed to extract %s as direct numeric: %s", planet_name, e, exc_info=True)
+                elif debug:
+                    logger.debug("  %s is not numeric (type: %s), will try as object later", planet_name, type(planet_val).__name__)
         
         # Also try angles as direct numeric values
         angle_attrs = {
@@ -322,351 +602,183 @@ def _extract_kerykeion_observable_objects(subj: AstrologicalSubject, requested_o
             'ic': 'ic',
         }
         for attr_name, obj_id in angle_attrs.items():
-            if hasattr(subj, attr_name):
-                try:
-                    angle_val = getattr(subj, attr_name)
+            angle_val = getattr(subj, attr_name, None)
+            if angle_val is not None:
+                if debug:
                     logger.debug("  Checking angle %s: type=%s, value=%s", attr_name, type(angle_val).__name__, angle_val)
-                    if isinstance(angle_val, (int, float)):
-                        if requested_objects and obj_id not in requested_objects and attr_name not in requested_objects:
+                if isinstance(angle_val, (int, float)):
+                    if req is not None and obj_id not in req and attr_name not in req:
+                        if debug:
                             logger.debug("  Skipping %s (not in requested_objects)", attr_name)
-                            continue
-                        normalized_lon = float(angle_val) % degrees_in_circle
-                        if normalized_lon < 0:
-                            normalized_lon += degrees_in_circle
-                        positions[obj_id] = normalized_lon
+                        continue
+                    normalized_lon = float(angle_val) % degrees_in_circle
+                    positions[obj_id] = normalized_lon
+                    if debug:
                         logger.debug("  ✓ Extracted %s as direct numeric value: %s", attr_name, normalized_lon)
-                    else:
-                        logger.debug("  %s is not numeric (type: %s), will try as object later", attr_name, type(angle_val).__name__)
-                except (ValueError, TypeError, AttributeError) as e:
-                    logger.debug("  Failed to extract %s as direct numeric: %s", attr_name, e, exc_info=True)
+                elif debug:
+                    logger.debug("  %s is not numeric (type: %s), will try as object later", attr_name, type(angle_val).__name__)
         
         # Try houses (first_house, second_house, etc. or eighth_house suggests they might be named differently)
-        house_attrs = [f'first_house', f'second_house', f'third_house', f'fourth_house', 
-                      f'fifth_house', f'sixth_house', f'seventh_house', f'eighth_house',
-                      f'ninth_house', f'tenth_house', f'eleventh_house', f'twelfth_house']
-        for i, house_attr in enumerate(house_attrs, 1):
-            if hasattr(subj, house_attr):
-                try:
-                    house_val = getattr(subj, house_attr)
+        for i, house_attr in enumerate(_HOUSE_ATTRS, 1):
+            house_val = getattr(subj, house_attr, None)
+            if house_val is not None:
+                if debug:
                     logger.debug("  Checking house %s: type=%s, value=%s", house_attr, type(house_val).__name__, house_val)
-                    if isinstance(house_val, (int, float)):
-                        house_id = f"house_{i}"
-                        if requested_objects and house_id not in requested_objects:
+                if isinstance(house_val, (int, float)):
+                    house_id = f"house_{i}"
+                    if req is not None and house_id not in req:
+                        if debug:
                             logger.debug("  Skipping %s (not in requested_objects)", house_attr)
-                            continue
-                        normalized_lon = float(house_val) % degrees_in_circle
-                        if normalized_lon < 0:
-                            normalized_lon += degrees_in_circle
-                        positions[house_id] = normalized_lon
+                        continue
+                    normalized_lon = float(house_val) % degrees_in_circle
+                    positions[house_id] = normalized_lon
+                    if debug:
                         logger.debug("  ✓ Extracted %s as direct numeric value: %s", house_attr, normalized_lon)
-                    else:
-                        logger.debug("  %s is not numeric (type: %s)", house_attr, type(house_val).__name__)
-                except (ValueError, TypeError, AttributeError) as e:
-                    logger.debug("  Failed to extract %s as direct numeric: %s", house_attr, e, exc_info=True)
+                elif debug:
+                    logger.debug("  %s is not numeric (type: %s)", house_attr, type(house_val).__name__)
         
         # Also try chiron and other calculated points
         calc_points = _get_kerykeion_calc_point_names(subj)
         for point_name in calc_points:
-            if hasattr(subj, point_name):
-                try:
-                    point_val = getattr(subj, point_name)
+            point_val = getattr(subj, point_name, None)
+            if point_val is not None:
+                if debug:
                     logger.debug("  Checking calculated point %s: type=%s, value=%s", point_name, type(point_val).__name__, point_val)
-                    if isinstance(point_val, (int, float)):
-                        obj_id = mapping.get(point_name, point_name)
-                        if requested_objects and obj_id not in requested_objects and point_name not in requested_objects:
+                if isinstance(point_val, (int, float)):
+                    obj_id = mapping.get(point_name, point_name)
+                    if accepted_raw is not None and point_name not in accepted_raw:
+                        if debug:
                             logger.debug("  Skipping %s (not in requested_objects)", point_name)
-                            continue
-                        normalized_lon = float(point_val) % degrees_in_circle
-                        if normalized_lon < 0:
-                            normalized_lon += degrees_in_circle
-                        positions[obj_id] = normalized_lon
+                        continue
+                    normalized_lon = float(point_val) % degrees_in_circle
+                    positions[obj_id] = normalized_lon
+                    if debug:
                         logger.debug("  ✓ Extracted %s as direct numeric value: %s", point_name, normalized_lon)
-                    else:
-                        logger.debug("  %s is not numeric (type: %s), will try as object later", point_name, type(point_val).__name__)
-                except (ValueError, TypeError, AttributeError) as e:
-                    logger.debug("  Failed to extract %s as direct numeric: %s", point_name, e, exc_info=True)
+                elif debug:
+                    logger.debug("  %s is not numeric (type: %s), will try as object later", point_name, type(point_val).__name__)
         
         if positions:
             logger.debug("Successfully extracted %d positions from direct numeric attributes", len(positions))
         else:
             logger.debug("No positions extracted from direct numeric attributes - all attributes may be objects, not numeric")
     
+    if req is not None and req <= positions.keys():
+        return positions
+    
     # Extract from KerykeionPointModel attributes (if available)
     # This handles planets/angles/houses that are objects, not direct numeric values
     if KerykeionPointModel is not None:
         logger.debug("Checking for KerykeionPointModel objects...")
-        for attr_name in dir(subj):
-            if attr_name.startswith('_'):
+        point_attrs = _KERYKEION_POINT_ATTRS
+        if accepted_raw is not None:
+            # Only probe the attributes that can satisfy the request
+            point_attrs = [a for a in point_attrs if a in accepted_raw]
+        for attr_name in point_attrs:
+            attr = getattr(subj, attr_name, None)
+            if not isinstance(attr, KerykeionPointModel):
                 continue
+            # Try to get the object name/id
+            obj_name = str(getattr(attr, "name", None) or attr_name).strip().lower()
+            # Normalize name using mapping
+            obj_id = mapping.get(obj_name, obj_name)
+            
+            # Check if this object is requested
+            if accepted_raw is not None and obj_name not in accepted_raw:
+                continue
+            
+            # Extract longitude - abs_pos (absolute position 0-360) first,
+            # read straight from the model's __dict__
+            lon_val = _point_longitude(attr)
+            if lon_val is None:
+                if debug:
+                    logger.debug("  ✗ Could not extract longitude from %s (tried abs_pos, position, sign_num calculation)", attr_name)
+                continue
+            # Only the numeric conversion can fail here
             try:
-                attr = getattr(subj, attr_name)
-                if isinstance(attr, KerykeionPointModel):
-                    # Try to get the object name/id
-                    obj_name = (getattr(attr, "name", None) or attr_name or "").strip().lower()
-                    # Normalize name using mapping
-                    obj_id = mapping.get(obj_name, obj_name)
-                    
-                    # Check if this object is requested
-                    if requested_objects and obj_id not in requested_objects and obj_name not in requested_objects:
-                        continue
-                    
-                    # Extract longitude - prioritize abs_pos (absolute position 0-360)
-                    lon_val = None
-                    
-                    # FIRST: Try abs_pos directly (most reliable for newer Kerykeion)
-                    if hasattr(attr, 'abs_pos'):
-                        try:
-                            lon_val = getattr(attr, 'abs_pos')
-                            logger.debug("  ✓ Extracted %s.abs_pos = %s", attr_name, lon_val)
-                        except (AttributeError, TypeError):
-                            pass
-                    
-                    # SECOND: Try abs_pos from __dict__ (in case it's not a direct attribute)
-                    if lon_val is None and hasattr(attr, '__dict__'):
-                        if 'abs_pos' in attr.__dict__:
-                            try:
-                                lon_val = attr.__dict__['abs_pos']
-                                logger.debug("  ✓ Extracted %s.__dict__['abs_pos'] = %s", attr_name, lon_val)
-                            except (KeyError, TypeError):
-                                pass
-                    
-                    # THIRD: Try standard longitude keys
-                    if lon_val is None:
-                        for k in lon_keys:
-                            if hasattr(attr, k):
-                                try:
-                                    lon_val = getattr(attr, k)
-                                    logger.debug("  ✓ Extracted %s.%s = %s", attr_name, k, lon_val)
-                                    break
-                                except (AttributeError, TypeError):
-                                    continue
-                    
-                    # FOURTH: Try position + sign_num calculation
-                    if lon_val is None:
-                        if hasattr(attr, '__dict__'):
-                            if 'position' in attr.__dict__ and 'sign_num' in attr.__dict__:
-                                try:
-                                    sign_num = attr.__dict__.get('sign_num', 0)
-                                    pos_val = attr.__dict__['position']
-                                    # position is 0-30 within sign, sign_num is 0-11 (Aries=0, Taurus=1, etc.)
-                                    # Absolute longitude = sign_num * 30 + position
-                                    lon_val = float(sign_num) * 30.0 + float(pos_val)
-                                    logger.debug("  ✓ Calculated %s from sign_num=%s + position=%s = %s", attr_name, sign_num, pos_val, lon_val)
-                                except (ValueError, TypeError, KeyError):
-                                    pass
-                            elif 'position' in attr.__dict__:
-                                try:
-                                    lon_val = attr.__dict__['position']
-                                    logger.debug("  ✓ Extracted %s.__dict__['position'] = %s", attr_name, lon_val)
-                                except (KeyError, TypeError):
-                                    pass
-                    
-                    # FIFTH: Try position as direct attribute
-                    if lon_val is None and hasattr(attr, 'position'):
-                        try:
-                            pos_val = getattr(attr, 'position')
-                            if hasattr(attr, 'sign_num'):
-                                try:
-                                    sign_num = getattr(attr, 'sign_num', 0)
-                                    lon_val = float(sign_num) * 30.0 + float(pos_val)
-                                    logger.debug("  ✓ Calculated %s from sign_num=%s + position=%s = %s", attr_name, sign_num, pos_val, lon_val)
-                                except (ValueError, TypeError):
-                                    lon_val = pos_val
-                            else:
-                                lon_val = pos_val
-                                logger.debug("  ✓ Extracted %s.position = %s", attr_name, lon_val)
-                        except (AttributeError, TypeError):
-                            pass
-                    
-                    if lon_val is not None:
-                        try:
-                            # Normalize to [0, 360) range (same as JPL)
-                            lon_float = float(lon_val)
-                            normalized_lon = lon_float % degrees_in_circle
-                            if normalized_lon < 0:
-                                normalized_lon += degrees_in_circle
-                            positions[obj_id] = normalized_lon
-                            logger.debug("  ✓ Added %s -> %s (normalized)", obj_id, normalized_lon)
-                        except (ValueError, TypeError) as e:
-                            logger.debug("  ✗ Failed to normalize %s: %s", attr_name, e)
-                            continue
-                    else:
-                        logger.debug("  ✗ Could not extract longitude from %s (tried abs_pos, position, sign_num calculation)", attr_name)
-            except (AttributeError, KeyError, TypeError, ValueError) as e:
-                logger.debug("  ✗ Exception extracting from %s: %s", attr_name, e, exc_info=True)
+                # Normalize to [0, 360) range (same as JPL)
+                normalized_lon = float(lon_val) % degrees_in_circle
+            except (ValueError, TypeError) as e:
+                if debug:
+                    logger.debug("  ✗ Failed to normalize %s: %s", attr_name, e)
                 continue
+            positions[obj_id] = normalized_lon
+            if debug:
+                logger.debug("  ✓ Added %s -> %s (normalized)", obj_id, normalized_lon)
+    
+    if req is not None and req <= positions.keys():
+        return positions
     
     # Direct planet attribute extraction (for newer kerykeion versions)
     # Try accessing planets directly as attributes (sun, moon, mercury, etc.)
-    planet_attrs = ['sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto']
+    planet_attrs = _PLANET_ATTRS
     for planet_name in planet_attrs:
-        if hasattr(subj, planet_name):
-            try:
-                planet_obj = getattr(subj, planet_name)
-                if planet_obj is None:
-                    continue
-                # Try to extract longitude from the planet object
-                lon_val = None
-                # FIRST: Try accessing via __dict__ for position/abs_pos (newer kerykeion versions)
-                # This must be checked first because position/abs_pos are in __dict__ but not as direct attributes
-                if hasattr(planet_obj, '__dict__'):
-                    # Prefer abs_pos over position (abs_pos is absolute longitude, position might be relative to sign)
-                    if 'abs_pos' in planet_obj.__dict__:
-                        lon_val = planet_obj.__dict__['abs_pos']
-                    elif 'position' in planet_obj.__dict__:
-                        pos_val = planet_obj.__dict__['position']
-                        # If position is relative to sign, calculate absolute from sign_num + position
-                        if 'sign_num' in planet_obj.__dict__:
-                            sign_num = planet_obj.__dict__.get('sign_num', 0)
-                            try:
-                                # position is 0-30 within sign, sign_num is 0-11 (Aries=0, Taurus=1, etc.)
-                                # Absolute longitude = sign_num * 30 + position
-                                lon_val = float(sign_num) * 30.0 + float(pos_val)
-                            except (ValueError, TypeError):
-                                # If calculation fails, try using position as-is
-                                lon_val = pos_val
-                        else:
-                            lon_val = pos_val
-                
-                # SECOND: Try standard attribute access (hasattr/getattr)
-                if lon_val is None:
-                    for k in lon_keys:
-                        if hasattr(planet_obj, k):
-                            lon_val = getattr(planet_obj, k)
-                            break
-                
-                # THIRD: Try accessing as a dict if it's dict-like
-                if lon_val is None and isinstance(planet_obj, dict):
-                    for k in lon_keys:
-                        if k in planet_obj:
-                            lon_val = planet_obj[k]
-                            break
-                
-                # FOURTH: Try __dict__ for standard longitude keys as fallback
-                if lon_val is None and hasattr(planet_obj, '__dict__'):
-                    for k in lon_keys:
-                        if k in planet_obj.__dict__:
-                            lon_val = planet_obj.__dict__[k]
+        # Same filter as the passes above, so the result does not depend on which pass filled it
+        if accepted_raw is not None and planet_name not in accepted_raw:
+            continue
+        planet_obj = getattr(subj, planet_name, None)
+        if planet_obj is None:
+            continue
+        lon_val = _point_longitude(planet_obj)
+        if lon_val is None:
+            continue
+        try:
+            # Convert to float and normalize to [0, 360) range (same as JPL)
+            positions[planet_name] = float(lon_val) % DEGREES_IN_CIRCLE
+        except (ValueError, TypeError):
+            # If position is a dict or complex object, try to extract numeric value
+            if isinstance(lon_val, dict):
+                # Try common keys that might contain the degree value
+                for key in ['degree', 'deg', 'longitude', 'lon', 'value', 'abs']:
+                    if key in lon_val:
+                        try:
+                            positions[planet_name] = float(lon_val[key]) % degrees_in_circle
                             break
-                
-                if lon_val is not None:
-                    try:
-                        # Convert to float and normalize to [0, 360) range (same as JPL)
-                        lon_float = float(lon_val)
-                        # Normalize to [0, 360) range (same normalization as JPL)
-                        normalized_lon = lon_float % DEGREES_IN_CIRCLE
-                        if normalized_lon < 0:
-                            normalized_lon += DEGREES_IN_CIRCLE
-                        positions[planet_name] = normalized_lon
-                    except (ValueError, TypeError) as e:
-                        # If position is a dict or complex object, try to extract numeric value
-                        if isinstance(lon_val, dict):
-                            # Try common keys that might contain the degree value
-                            for key in ['degree', 'deg', 'longitude', 'lon', 'value', 'abs']:
-                                if key in lon_val:
-                                    try:
-                                        normalized_lon = float(lon_val[key]) % degrees_in_circle
-                                        if normalized_lon < 0:
-                                            normalized_lon += degrees_in_circle
-                                        positions[planet_name] = normalized_lon
-                                        break
-                                    except (ValueError, TypeError, KeyError):
-                                        continue
-                        continue
-            except (AttributeError, KeyError, TypeError, ValueError):
-                continue
+                        except (ValueError, TypeError):
+                            continue
     
-    # Extract houses from houses_list if available
-    if hasattr(subj, 'houses_list') and isinstance(subj.houses_list, list):
-        for i, house_info in enumerate(subj.houses_list, 1):
-            house_id = f"house_{i}"
-            if requested_objects and house_id not in requested_objects:
-                continue
-            try:
-                if isinstance(house_info, dict):
-                    # Try different possible keys
-                    degree = (house_info.get('longitude') or 
-                             house_info.get('lon') or 
-                             house_info.get('degree') or
-                             house_info.get('cusp'))
-                    if degree is not None:
-                        # Normalize to [0, 360) range (same as JPL)
-                        lon_float = float(degree)
-                        normalized_lon = lon_float % degrees_in_circle
-                        if normalized_lon < 0:
-                            normalized_lon += degrees_in_circle
-                        positions[house_id] = normalized_lon
-                elif hasattr(house_info, 'longitude'):
-                    # Normalize to [0, 360) range (same as JPL)
-                    lon_float = float(house_info.longitude)
-                    normalized_lon = lon_float % degrees_in_circle
-                    if normalized_lon < 0:
-                        normalized_lon += degrees_in_circle
-                    positions[house_id] = normalized_lon
-            except (ValueError, TypeError, AttributeError):
-                continue
+    return positions
+
+
+def _extract_positions_array(subj: AstrologicalSubject, requested_objects: Optional[Collection[str]] = None,
+                             model: Optional[AstroModel] = None) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Extract observable objects as parallel (names, longitudes) for vectorized use.
     
-    # Note: planets_list extraction is now done at the start of the function
-    # This section is kept for backward compatibility but should not be reached if the above worked
+    Wraps _extract_kerykeion_observable_objects so callers can broadcast over
+    all positions at once, e.g. np.abs(lons[:, None] - lons[None, :]) % 360.
     
-    return positions
+    Returns:
+        Tuple of (object_ids, float64 array of ecliptic longitudes in the same order)
+    """
+    positions = _extract_kerykeion_observable_objects(subj, requested_objects, model)
+    names = tuple(positions)
+    lons = np.fromiter((positions[n] for n in names), dtype=np.float64, count=len(names))
+    return names, lons
 
 
 # ─────────────────────
 # 🪐 POSITION CALCULATIONS (Skyfield-based for JPL)
 # ─────────────────────
 
-def _compute_planet_ecliptic_longitude(body, eph, observer, t, vernal_equinox_offset: float) -> Optional[float]:
-    """Compute ecliptic longitude for a planet from RA/Dec.
+@njit(cache=True)
+def _radec_to_ecliptic_longitude(ra_hours: float, dec_degrees: float, vernal_equinox_offset: float) -> float:
+    """Convert RA/Dec to tropical ecliptic longitude using the J2000.0 obliquity.
+    
+    Formula: tan(ecl_lon) = (sin(RA) * cos(obl) + tan(Dec) * sin(obl)) / cos(RA)
+    Compiled with numba when it is installed.
     
-    Args:
-        body: Skyfield body object
-        eph: Skyfield ephemeris
-        observer: Skyfield Topos observer
-        t: Skyfield time object
-        vernal_equinox_offset: Offset to adjust for vernal equinox
-        
     Returns:
-        Ecliptic longitude in degrees [0, 360), or None on error
+        Ecliptic longitude in degrees [0, 360)
     """
-    try:
-        astrometric = (eph["earth"] + observer).at(t).observe(body).apparent()
-        ra, dec, _ = astrometric.radec()
-        
-        # Compute ecliptic longitude from RA/Dec using J2000.0 obliquity
-        ra_deg = ra.hours * 15.0  # Convert hours to degrees
-        dec_deg = dec.degrees
-        ra_rad = math.radians(ra_deg)
-        dec_rad = math.radians(dec_deg)
-        obliquity_j2000_deg = OBLIQUITY_J2000_DEGREES
-        obliquity_j2000 = math.radians(obliquity_j2000_deg)  # J2000.0 obliquity
-        
-        # Formula: tan(ecl_lon) = (sin(RA) * cos(obl) + tan(Dec) * sin(obl)) / cos(RA)
-        sin_ra = math.sin(ra_rad)
-        cos_ra = math.cos(ra_rad)
-        tan_dec = math.tan(dec_rad)
-        sin_obl = math.sin(obliquity_j2000)
-        cos_obl = math.cos(obliquity_j2000)
-        
-        ecl_lon_rad = math.atan2(sin_ra * cos_obl + tan_dec * sin_obl, cos_ra)
-        lon_deg = math.degrees(ecl_lon_rad) % DEGREES_IN_CIRCLE
-        if lon_deg < 0:
-            lon_deg += DEGREES_IN_CIRCLE
-        
-        # Adjust for vernal equinox: subtract the offset so vernal equinox = 0°
-        lon_deg_tropical = (lon_deg - vernal_equinox_offset) % DEGREES_IN_CIRCLE
-        if lon_deg_tropical < 0:
-            lon_deg_tropical += DEGREES_IN_CIRCLE
-        
-        return lon_deg_tropical
-    except (KeyError, ValueError, AttributeError) as e:
-        logger.warning("Could not compute planet position: %s", e)
-        return None
+    ra = math.radians(ra_hours * 15.0)
+    dec = math.radians(dec_degrees)
+    ecl_lon = math.atan2(math.sin(ra) * _COS_OBL_J2000 + math.tan(dec) * _SIN_OBL_J2000, math.cos(ra))
+    return (math.degrees(ecl_lon) - vernal_equinox_offset) % DEGREES_IN_CIRCLE
 
 
 def _compute_planet_extended_position(body, eph, observer, t, vernal_equinox_offset: float, 
                                       include_physical: bool = False, 
-                                      include_topocentric: bool = False) -> Optional[Dict[str, float]]:
+                                      include_topocentric: bool = False,
+                                      observer_at_t=None) -> Optional[Dict[str, float]]:
     """Compute extended position data for a planet using Skyfield.
     
     Args:
@@ -677,6 +789,8 @@ def _compute_planet_extended_position(body, eph, observer, t, vernal_equinox_off
         vernal_equinox_offset: Offset to adjust for vernal equinox
         include_physical: If True, include magnitude/phase/elongation
         include_topocentric: If True, include altitude/azimuth
+        observer_at_t: Optional precomputed (eph["earth"] + observer).at(t), so
+            callers looping over bodies evaluate the observer geometry once
         
     Returns:
         Dictionary with position data, or None on error. Keys:
@@ -695,7 +809,9 @@ def _compute_planet_extended_position(body, eph, observer, t, vernal_equinox_off
         - retrograde: bool (if available)
     """
     try:
-        astrometric = (eph["earth"] + observer).at(t).observe(body).apparent()
+        if observer_at_t is None:
+            observer_at_t = (eph["earth"] + observer).at(t)
+        astrometric = observer_at_t.observe(body).apparent()
         ra, dec, distance = astrometric.radec()
         
         # Always compute basic equatorial coordinates
@@ -703,27 +819,8 @@ def _compute_planet_extended_position(body, eph, observer, t, vernal_equinox_off
         dec_deg = dec.degrees
         distance_au = distance.au  # Distance in AU
         
-        # Compute ecliptic longitude from RA/Dec
-        ra_rad = math.radians(ra_deg)
-        dec_rad = math.radians(dec_deg)
-        obliquity_j2000_deg = OBLIQUITY_J2000_DEGREES
-        obliquity_j2000 = math.radians(obliquity_j2000_deg)  # J2000.0 obliquity
-        
-        sin_ra = math.sin(ra_rad)
-        cos_ra = math.cos(ra_rad)
-        tan_dec = math.tan(dec_rad)
-        sin_obl = math.sin(obliquity_j2000)
-        cos_obl = math.cos(obliquity_j2000)
-        
-        ecl_lon_rad = math.atan2(sin_ra * cos_obl + tan_dec * sin_obl, cos_ra)
-        lon_deg = math.degrees(ecl_lon_rad) % DEGREES_IN_CIRCLE
-        if lon_deg < 0:
-            lon_deg += DEGREES_IN_CIRCLE
-        
-        # Adjust for vernal equinox
-        lon_deg_tropical = (lon_deg - vernal_equinox_offset) % DEGREES_IN_CIRCLE
-        if lon_deg_tropical < 0:
-            lon_deg_tropical += DEGREES_IN_CIRCLE
+        # Compute ecliptic longitude from RA/Dec, adjusted for vernal equinox
+        lon_deg_tropical = _radec_to_ecliptic_longitude(ra.hours, dec_deg, vernal_equinox_offset)
         
         # Build result dictionary
         result = {
@@ -740,12 +837,9 @@ def _compute_planet_extended_position(body, eph, observer, t, vernal_equinox_off
         # Topocentric coordinates (altitude/azimuth)
         if include_topocentric:
             try:
-                # Compute topocentric position (observer's view from Earth's surface)
-                # Use the same pattern as astrometric: (eph["earth"] + observer).at(t).observe(body)
-                # This gives us the position from the observer's location on Earth's surface
-                topocentric = (eph["earth"] + observer).at(t).observe(body).apparent()
-                # Now compute altaz from the observer's perspective
-                alt, az, distance_altaz = topocentric.altaz()
+                # The astrometric position is already observed from the observer's
+                # location on Earth's surface, so altaz can be read from it directly
+                alt, az, distance_altaz = astrometric.altaz()
                 result['altitude'] = float(alt.degrees)
                 result['azimuth'] = float(az.degrees)
             except (AttributeError, KeyError, TypeError, ValueError) as e:
@@ -765,7 +859,7 @@ def _compute_planet_extended_position(body, eph, observer, t, vernal_equinox_off
                 # Elongation: angular distance from Sun
                 try:
                     sun = eph["sun"]
-                    sun_astrometric = (eph["earth"] + observer).at(t).observe(sun).apparent()
+                    sun_astrometric = observer_at_t.observe(sun).apparent()
                     # Compute elongation (simplified - full calculation would use spherical trigonometry)
                     # For now, approximate using ecliptic longitude difference
                     sun_ra, sun_dec, _ = sun_astrometric.radec()
@@ -799,52 +893,132 @@ def _compute_planet_extended_position(body, eph, observer, t, vernal_equinox_off
         return None
 
 
-def _compute_single_planet_position(planet: str, eph, observer, t, is_de421: bool, 
-                                     vernal_equinox_offset: float) -> Optional[float]:
-    """Compute position for a single planet.
+def _resolve_jpl_body(planet: str, eph, is_de421: bool):
+    """Look up the Skyfield body for a planet, using barycenters where needed.
+    
+    Returns:
+        Skyfield body object, or None if the ephemeris does not provide it
+    """
+    if is_de421 and planet in _OUTER_PLANETS:
+        try:
+            return eph[f"{planet} barycenter"]
+        except KeyError:
+            pass
+    try:
+        return eph[planet]
+    except KeyError:
+        # Some kernels (e.g. de421 for Mars) only carry the system barycenter
+        try:
+            return eph[f"{planet} barycenter"]
+        except KeyError:
+            pass
+    return None
+
+
+def _get_jpl_body_handles(eph, is_de421: bool) -> Mapping[str, Any]:
+    """Return planet -> Skyfield body for every supported planet the ephemeris provides.
+    
+    Resolved once per loaded ephemeris, so the per-chart loops do plain dict
+    lookups instead of KeyError-driven fallbacks. Planets the file lacks are
+    logged once and left out.
+    """
+    key = (id(eph), bool(is_de421))
+    entry = _BODY_HANDLES_CACHE.get(key)
+    # The ephemeris is stored alongside its handles so a recycled id cannot match
+    if entry is not None and entry[0] is eph:
+        return entry[1]
+    handles = {}
+    for planet in _JPL_SUPPORTED:
+        body = _resolve_jpl_body(planet, eph, is_de421)
+        if body is None:
+            logger.warning("Could not resolve %s in ephemeris", planet)
+        else:
+            handles[planet] = body
+    handles = MappingProxyType(handles)
+    _BODY_HANDLES_CACHE[key] = (eph, handles)
+    return handles
+
+
+# ICRF (J2000 equatorial) -> J2000 ecliptic rotation about the x axis
+_ICRF_TO_ECLIPTIC_J2000 = np.array([
+    [1.0, 0.0, 0.0],
+    [0.0, _COS_OBL_J2000, _SIN_OBL_J2000],
+    [0.0, -_SIN_OBL_J2000, _COS_OBL_J2000],
+])
+
+
+@njit(fastmath=True, cache=True)
+def _icrf_to_ecliptic_longitudes(vectors: np.ndarray, offsets: np.ndarray,
+                                 sin_obl: float, cos_obl: float) -> np.ndarray:
+    """Fused rotation + atan2 + offset + wrap over (N, 3) vectors in one loop.
+    
+    Only used when numba is installed; the plain-Python loop would be slower
+    than the NumPy expression in _ecliptic_longitudes_from_icrf.
+    """
+    n = vectors.shape[0]
+    out = np.empty(n)
+    for k in range(n):
+        y = cos_obl * vectors[k, 1] + sin_obl * vectors[k, 2]
+        out[k] = (math.degrees(math.atan2(y, vectors[k, 0])) - offsets[k]) % DEGREES_IN_CIRCLE
+    return out
+
+
+def _ecliptic_longitudes_from_icrf(vectors, vernal_equinox_offset: float) -> np.ndarray:
+    """Convert stacked apparent ICRF position vectors to tropical ecliptic longitudes.
+    
+    Rotating (x, y, z) by the J2000.0 obliquity gives the same longitude as the
+    RA/Dec formula in _radec_to_ecliptic_longitude, but for all bodies in one pass.
     
     Args:
-        planet: Planet name (e.g., "jupiter")
-        eph: Skyfield ephemeris
-        observer: Skyfield Topos observer
-        t: Skyfield time object
-        is_de421: Whether using de421 ephemeris (requires barycenters for outer planets)
-        vernal_equinox_offset: Offset to adjust for vernal equinox
+        vectors: Array of shape (N, 3) with apparent positions (any length unit)
+        vernal_equinox_offset: Offset to adjust for vernal equinox; a scalar, or
+            an array of shape (N,) when the vectors span several years
         
     Returns:
-        Ecliptic longitude in degrees [0, 360), or None on error
+        Array of ecliptic longitudes in degrees [0, 360)
     """
-    outer_planets = ["jupiter", "saturn", "uranus", "neptune", "pluto"]
+    vectors = np.asarray(vectors, dtype=np.float64)
+    if NUMBA:
+        # Compiled kernel avoids the temporaries between each NumPy ufunc
+        offsets = np.ascontiguousarray(np.broadcast_to(
+            np.asarray(vernal_equinox_offset, dtype=np.float64), (vectors.shape[0],)))
+        return _icrf_to_ecliptic_longitudes(np.ascontiguousarray(vectors), offsets, _SIN_OBL_J2000, _COS_OBL_J2000)
+    ecliptic = np.einsum('ij,nj->ni', _ICRF_TO_ECLIPTIC_J2000, vectors)
+    ecl_lon = np.arctan2(ecliptic[:, 1], ecliptic[:, 0])
+    return (np.rad2deg(ecl_lon) - vernal_equinox_offset) % DEGREES_IN_CIRCLE
+
+
+def _compute_all_ecliptic_longitudes(bodies: Mapping[str, Any], observer_at_t,
+                                     vernal_equinox_offset: float) -> Dict[str, float]:
+    """Compute ecliptic longitudes for several bodies from one observer position.
     
-    # For de421, always try barycenter first for outer planets to avoid Skyfield errors
-    if is_de421 and planet in outer_planets:
-        body_name = f"{planet} barycenter"
+    The apparent position of every body is stacked and rotated to the ecliptic
+    in a single pass; bodies whose observation fails are logged and skipped.
+    
+    Args:
+        bodies: Mapping of planet name -> resolved Skyfield body
+        observer_at_t: Earth+observer position at the chart time
+        vernal_equinox_offset: Offset to adjust for vernal equinox
+        
+    Returns:
+        Mapping planet -> ecliptic longitude in degrees [0, 360)
+    """
+    computed, vectors = [], []
+    for planet, body in bodies.items():
         try:
-            body = eph[body_name]
-            return _compute_planet_ecliptic_longitude(body, eph, observer, t, vernal_equinox_offset)
+            vectors.append(observer_at_t.observe(body).apparent().position.au)
         except (KeyError, ValueError, AttributeError) as e:
-            logger.warning("Could not compute %s barycenter position: %s", planet, e)
-            return None
-    
-    # For non-de421 or inner planets, try direct name first
-    try:
-        body = eph[planet]
-        return _compute_planet_ecliptic_longitude(body, eph, observer, t, vernal_equinox_offset)
-    except KeyError:
-        # If direct access fails, try barycenter for outer planets (for other ephemeris files)
-        if planet in outer_planets:
-            try:
-                body_name = f"{planet} barycenter"
-                body = eph[body_name]
-                return _compute_planet_ecliptic_longitude(body, eph, observer, t, vernal_equinox_offset)
-            except (KeyError, ValueError, AttributeError) as e:
-                logger.warning("Could not compute %s position: %s", planet, e)
-                return None
-        return None
+            logger.warning("Could not compute %s position: %s", planet, e)
+            continue
+        computed.append(planet)
+    if not computed:
+        return {}
+    longitudes = _ecliptic_longitudes_from_icrf(np.stack(vectors), vernal_equinox_offset)
+    return {planet: float(lon) for planet, lon in zip(computed, longitudes)}
 
 
 def compute_jpl_positions(name: str, dt_str: str, loc_str: str, ephemeris_path: Optional[str] = None,
-                          requested_objects: Optional[List[str]] = None,
+                          requested_objects: Optional[Collection[str]] = None,
                           include_physical: bool = False,
                           include_topocentric: bool = False,
                           extended: bool = False) -> Dict[str, Union[float, Dict[str, float]]]:
@@ -865,76 +1039,149 @@ def compute_jpl_positions(name: str, dt_str: str, loc_str: str, ephemeris_path:
     - Empty dict if computation is unavailable
     """
     if JPL:
-        ts = load.timescale()
-        time = Actual(dt_str, t="date")
-        place = Actual(loc_str, t="loc")
+        ts = _get_timescale()
+        place = _parse_place(loc_str)
 
         # Ensure timezone-aware datetime using centralized utils
-        dt_aware = ensure_aware(time.value, getattr(place, 'tz', None))
-        t = ts.from_datetime(dt_aware)
+        dt_aware = ensure_aware(_parse_chart_datetime(dt_str), getattr(place, 'tz', None))
         
         eph_file = ephemeris_path or default_ephemeris_path()
-        # Use load_file for explicit local path support
-        eph = load_file(eph_file)
-        observer = Topos(latitude_degrees=place.value.latitude, longitude_degrees=place.value.longitude)
-        
-        # Check if we're using de421 (which requires barycenters for outer planets: Jupiter, Saturn, Uranus, Neptune, Pluto)
-        is_de421 = eph_file and "de421" in Path(eph_file).name.lower()
         
         # Determine which planets to compute
-        jpl_supported = ["sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto"]
         if requested_objects:
             # Filter to only requested objects that JPL can compute
-            planets = [p for p in jpl_supported if p in requested_objects]
+            req = frozenset(requested_objects)
+            planets = tuple(p for p in _JPL_SUPPORTED if p in req)
         else:
-            planets = jpl_supported
+            planets = _JPL_SUPPORTED
+        
+        # Queries in the same per-body time window, at locations equal to 4 decimals
+        # (~10 m), share one entry computed at the start of the window
+        bucket = _cache_time_bucket(dt_aware, planets, extended and include_topocentric)
+        cache_key = (
+            bucket,
+            round(place.value.latitude, 4),
+            round(place.value.longitude, 4),
+            eph_file,
+            planets,
+            extended,
+            include_physical,
+            include_topocentric,
+        )
+        cached = _JPL_POSITION_CACHE.get(cache_key)
+        if cached is not None:
+            _JPL_POSITION_CACHE.move_to_end(cache_key)
+            return _copy_positions(cached)
+        
+        table = _LONGITUDE_TABLE
+        if not extended and table is not None and table.covers(
+                dt_aware, place.value.latitude, place.value.longitude, eph_file, planets):
+            # Interpolation is cheaper than a cache entry; each call gets a fresh dict
+            return table.lookup_longitudes(dt_aware, planets)
+
+        # Evaluate at the window start so the cached result does not depend on which query came first
+        dt_eval = datetime.fromtimestamp(bucket, tz=dt_aware.tzinfo)
+        t = ts.from_datetime(dt_eval)
+
+        # Use load_file for explicit local path support
+        eph = _get_ephemeris(eph_file)
+        observer = Topos(latitude_degrees=place.value.latitude, longitude_degrees=place.value.longitude)
+        
+        # Check if we're using de421 (which requires barycenters for outer planets: Jupiter, Saturn, Uranus, Neptune, Pluto)
+        is_de421 = eph_file and "de421" in Path(eph_file).name.lower()
         
         positions = {}
         
         # For tropical astrology, we need to adjust for the vernal equinox of date
-        year = dt_aware.year
-        vernal_equinox_offset = compute_vernal_equinox_offset(year, eph, observer, ts)
-
-        for planet in planets:
-            if extended:
-                # Get body for extended computation
-                body = None
-                outer_planets = ["jupiter", "saturn", "uranus", "neptune", "pluto"]
-                if is_de421 and planet in outer_planets:
-                    try:
-                        body = eph[f"{planet} barycenter"]
-                    except KeyError:
-                        pass
-                if body is None:
-                    try:
-                        body = eph[planet]
-                    except KeyError:
-                        if planet in outer_planets:
-                            try:
-                                body = eph[f"{planet} barycenter"]
-                            except KeyError:
-                                pass
-                
-                if body is not None:
-                    extended_pos = _compute_planet_extended_position(
-                        body, eph, observer, t, vernal_equinox_offset,
-                        include_physical=include_physical,
-                        include_topocentric=include_topocentric
-                    )
-                    if extended_pos is not None:
-                        positions[planet] = extended_pos
-            else:
-                # Legacy mode: return only longitude
-                lon_deg_tropical = _compute_single_planet_position(planet, eph, observer, t, is_de421, vernal_equinox_offset)
-                if lon_deg_tropical is not None:
-                    positions[planet] = lon_deg_tropical
+        vernal_equinox_offset = _get_vernal_equinox_offset(eph_file, dt_eval.year, eph, observer, ts)
+
+        # Body handles are resolved once per ephemeris; evaluate the observer
+        # geometry once so all bodies are observed from the same position
+        handles = _get_jpl_body_handles(eph, is_de421)
+        bodies = {planet: handles[planet] for planet in planets if planet in handles}
+        observer_at_t = (eph["earth"] + observer).at(t)
+
+        if extended:
+            for planet, body in bodies.items():
+                extended_pos = _compute_planet_extended_position(
+                    body, eph, observer, t, vernal_equinox_offset,
+                    include_physical=include_physical,
+                    include_topocentric=include_topocentric,
+                    observer_at_t=observer_at_t,
+                )
+                if extended_pos is not None:
+                    positions[planet] = extended_pos
+        else:
+            # Legacy mode: return only longitude
+            positions = _compute_all_ecliptic_longitudes(bodies, observer_at_t, vernal_equinox_offset)
 
-        return positions
+        _JPL_POSITION_CACHE[cache_key] = positions
+        if len(_JPL_POSITION_CACHE) > _JPL_POSITION_CACHE_SIZE:
+            _JPL_POSITION_CACHE.popitem(last=False)
+        return _copy_positions(positions)
     else:
         # Return empty dict to maintain consistent return type
         return {}
 
 
+def compute_jpl_longitudes_batch(dt_list: List[Union[str, datetime]], loc_str: str,
+                                 ephemeris_path: Optional[str] = None,
+                                 requested_objects: Optional[Collection[str]] = None) -> Dict[str, np.ndarray]:
+    """Compute JPL ecliptic longitudes for many times at one location in one pass.
+    
+    Builds a single array-valued Skyfield Time, evaluates the observer position
+    once and observes each body for all samples together, so timescale, nutation
+    and aberration work is amortised across the whole series.
+    
+    Parameters:
+    - dt_list: datetimes or datetime strings (parsed by utils.Actual)
+    - loc_str: location string (parsed by utils.Actual)
+    - ephemeris_path: optional path to a local BSP file; falls back to default
+    - requested_objects: optional list of object IDs; non-JPL objects are ignored
+    
+    Returns:
+    - Mapping planet -> array of ecliptic longitudes with one entry per input time
+    - Empty dict if JPL is unavailable or dt_list is empty
+    """
+    if not JPL or not dt_list:
+        return {}
+    ts = _get_timescale()
+    place = _parse_place(loc_str)
+    tz = getattr(place, 'tz', None)
+    dts = [ensure_aware(_parse_chart_datetime(dt), tz) for dt in dt_list]
+    t = ts.from_datetimes(dts)
+
+    eph_file = ephemeris_path or default_ephemeris_path()
+    eph = _get_ephemeris(eph_file)
+    observer = Topos(latitude_degrees=place.value.latitude, longitude_degrees=place.value.longitude)
+    is_de421 = eph_file and "de421" in Path(eph_file).name.lower()
+
+    if requested_objects:
+        req = frozenset(requested_objects)
+        planets = tuple(p for p in _JPL_SUPPORTED if p in req)
+    else:
+        planets = _JPL_SUPPORTED
+
+    # One offset per sample; each (ephemeris, year) pair is computed once
+    offsets = np.array([_get_vernal_equinox_offset(eph_file, dt.year, eph, observer, ts) for dt in dts])
+    observer_at_t = (eph["earth"] + observer).at(t)
+
+    handles = _get_jpl_body_handles(eph, is_de421)
+    positions: Dict[str, np.ndarray] = {}
+    for planet in planets:
+        body = handles.get(planet)
+        if body is None:
+            continue
+        try:
+            # position.au has shape (3, N) for an array-valued time
+            vectors = observer_at_t.observe(body).apparent().position.au
+        except (KeyError, ValueError, AttributeError) as e:
+            logger.warning("Could not compute %s positions: %s", planet, e)
+            continue
+        positions[planet] = _ecliptic_longitudes_from_icrf(np.asarray(vectors).T, offsets)
+    return positions
+
+
 # ─────────────────────
 # 🪐 POSITION CALCULATIONS (Kerykeion-based)
 # ─────────────────────
@@ -999,10 +1246,53 @@ def compute_subject(name: str, dt_str: str, loc_str: str, zodiac: str = "Tropica
     Returns:
         Astrological subject instance with computed positions
     """
-    time = Actual(dt_str, t="date")
-    place = Actual(loc_str, t="loc")
+    time = Actual(_parse_chart_datetime(dt_str), t="date")
+    place = _parse_place(loc_str)
     return _build_kerykeion_subject(name=name, time=time, place=place, zodiac=zodiac)
 
+
+@lru_cache(maxsize=256)
+def _compute_subject_cached(name: str, dt_str: str, loc_str: str) -> Any:
+    """compute_subject memoised on its exact string inputs (result is shared, read-only)."""
+    return compute_subject(name, dt_str, loc_str)
+
+
+def _compute_subject_for_positions(name: str, dt_str: str, loc_str: str) -> Any:
+    """Build a subject for position extraction, reusing earlier results for the same inputs.
+    
+    Relative or empty date strings ("today", "now", "") resolve against the
+    current time, so they bypass the cache.
+    """
+    if not _is_fixed_time(dt_str):
+        return compute_subject(name, dt_str, loc_str)
+    return _compute_subject_cached(name, dt_str, loc_str)
+
+
+_SUBJECT_DATA_CACHE_SIZE = 256
+_SUBJECT_DATA_CACHE: "OrderedDict[int, Tuple[Any, tuple]]" = OrderedDict()
+
+
+def _subject_data(subj: Any) -> tuple:
+    """Return Subject.data() for an already computed subject, reusing earlier results.
+    
+    Subjects from _compute_subject_for_positions are shared, so the (names, degrees,
+    labels) triple is cached per subject object. The subject itself is kept in the
+    entry so a recycled id() can never return another subject's data.
+    """
+    cached = _SUBJECT_DATA_CACHE.get(id(subj))
+    if cached is not None and cached[0] is subj:
+        _SUBJECT_DATA_CACHE.move_to_end(id(subj))
+        return cached[1]
+
+    wrapper = Subject("")
+    wrapper.computed = subj
+    data = wrapper.data()
+    _SUBJECT_DATA_CACHE[id(subj)] = (subj, data)
+    if len(_SUBJECT_DATA_CACHE) > _SUBJECT_DATA_CACHE_SIZE:
+        _SUBJECT_DATA_CACHE.popitem(last=False)
+    return data
+
+
 def extract_kerykeion_points(obj: Any) -> DataFrame:
     """Extract KerykeionPointModel attributes from an object into a DataFrame.
     
@@ -1016,12 +1306,32 @@ def extract_kerykeion_points(obj: Any) -> DataFrame:
         # KerykeionPointModel not available in this version
         return DataFrame()
     
-    data = []
-    for attr_name in dir(obj):
-        attr = getattr(obj, attr_name)
+    points = []
+    for attr_name in _point_attr_names(type(obj)):
+        attr = getattr(obj, attr_name, None)
         if isinstance(attr, KerykeionPointModel):
-            data.append(attr.__dict__)
-    return DataFrame(data)
+            points.append(attr.__dict__)
+    if not points:
+        return DataFrame()
+    # Build columns up front instead of letting pandas infer each row dict
+    fields = tuple(dict.fromkeys(k for p in points for k in p))
+    return DataFrame({f: [p.get(f) for p in points] for f in fields}, columns=fields)
+
+
+@lru_cache(maxsize=16)
+def _point_attr_names(cls: type) -> Tuple[str, ...]:
+    """Names of attributes on ``cls`` that can hold a KerykeionPointModel, sorted like dir().
+    
+    Pydantic subjects are classified once from their field annotations; other
+    classes fall back to their public attribute names (checked per instance).
+    """
+    fields = getattr(cls, 'model_fields', None)
+    if isinstance(fields, dict) and fields:
+        return tuple(sorted(
+            name for name, info in fields.items()
+            if info.annotation is KerykeionPointModel or KerykeionPointModel in get_args(info.annotation)
+        ))
+    return tuple(name for name in dir(cls) if not name.startswith('_'))
 
 
 # ─────────────────────
@@ -1269,6 +1579,32 @@ def compute_aspects_for_chart(
 # 🧬 MODEL MERGING
 # ─────────────────────
 
+def _apply_aspect_overrides(a: AspectDefinition, oe: Optional[OverrideEntry], orb: Optional[float]) -> AspectDefinition:
+    """Apply an aspect OverrideEntry (glyph/angle/default_orb/i18n) and override_orbs value.
+    
+    Returns the original definition when neither override applies.
+    """
+    if oe is None and orb is None:
+        return a
+    changes = {}
+    if oe is not None:
+        for attr in ('angle', 'default_orb', 'glyph', 'i18n'):
+            value = getattr(oe, attr)
+            if value is not None:
+                changes[attr] = value
+    if orb is not None:
+        changes['default_orb'] = float(orb)
+    return replace(a, **changes)
+
+
+def _apply_point_overrides(b: BodyDefinition, oe: Optional[OverrideEntry]) -> BodyDefinition:
+    """Apply a point OverrideEntry (glyph/i18n only; computed is metadata not on BodyDefinition)."""
+    if oe is None:
+        return b
+    changes = {attr: getattr(oe, attr) for attr in ('glyph', 'i18n') if getattr(oe, attr) is not None}
+    return replace(b, **changes)
+
+
 def merge_model_with_overrides(model: AstroModel, overrides: Optional[ModelOverrides]) -> AstroModel:
     """Return a new AstroModel with selective overrides applied.
     
@@ -1278,6 +1614,7 @@ def merge_model_with_overrides(model: AstroModel, overrides: Optional[ModelOverr
     - override_orbs: map of aspect-id -> orb to override AspectDefinition.default_orb
     
     This function does not mutate the original model; it returns a modified copy.
+    Definitions are frozen, so the copy shares unchanged ones instead of deep-copying.
     
     Args:
         model: Base AstroModel to apply overrides to
@@ -1289,71 +1626,95 @@ def merge_model_with_overrides(model: AstroModel, overrides: Optional[ModelOverr
     if not overrides:
         return model
 
-    m = deepcopy(model)
+    aspect_entries = getattr(overrides, 'aspects', None) or ()
+    point_entries = getattr(overrides, 'points', None) or ()
+    orb_map = getattr(overrides, 'override_orbs', None) or {}
+    # Overrides block present but nothing in it: the model is already effective
+    if not aspect_entries and not point_entries and not orb_map:
+        return model
 
-    # Index helpers
-    aspect_by_id: Dict[str, AspectDefinition] = {a.id: a for a in m.aspect_definitions}
-    body_by_id: Dict[str, BodyDefinition] = {b.id: b for b in m.body_definitions}
+    aspect_overrides = {oe.id: oe for oe in aspect_entries}
+    point_overrides = {oe.id: oe for oe in point_entries}
+
+    # Unchanged definitions (and the never-overridden signs list) are frozen and
+    # shared by reference with the base model; only mutable settings get a copy
+    return replace(
+        model,
+        aspect_definitions=[
+            _apply_aspect_overrides(a, aspect_overrides.get(a.id), orb_map.get(a.id))
+            for a in model.aspect_definitions
+        ],
+        body_definitions=[_apply_point_overrides(b, point_overrides.get(b.id)) for b in model.body_definitions],
+        settings=copy(model.settings),
+    )
 
-    # Apply aspect overrides
-    for oe in getattr(overrides, 'aspects', []) or []:
-        a = aspect_by_id.get(oe.id)
-        if not a:
-            continue
-        # Rebuild AspectDefinition with overrides
-        new_angle = oe.angle if oe.angle is not None else a.angle
-        new_orb = oe.default_orb if oe.default_orb is not None else a.default_orb
-        new_glyph = oe.glyph if oe.glyph is not None else a.glyph
-        new_i18n = oe.i18n if oe.i18n is not None else a.i18n
-        aspect_by_id[oe.id] = AspectDefinition(id=a.id, glyph=new_glyph, angle=new_angle, default_orb=new_orb, i18n=new_i18n)
-    m.aspect_definitions = list(aspect_by_id.values())
-
-    # Apply point overrides (glyph only; computed flag is metadata not present on BodyDefinition)
-    for oe in getattr(overrides, 'points', []) or []:
-        b = body_by_id.get(oe.id)
-        if not b:
-            continue
-        new_glyph = oe.glyph if oe.glyph is not None else b.glyph
-        new_formula = b.formula  # angle/element/avg_speed/max_orb are part of definition; only glyph/i18n commonly overridden
-        new_element = b.element
-        new_avg = b.avg_speed
-        new_max_orb = b.max_orb
-        new_i18n = oe.i18n if oe.i18n is not None else b.i18n
-        body_by_id[oe.id] = BodyDefinition(
-            id=b.id,
-            glyph=new_glyph,
-            formula=new_formula,
-            element=new_element,
-            avg_speed=new_avg,
-            max_orb=new_max_orb,
-            i18n=new_i18n,
-        )
-    m.body_definitions = list(body_by_id.values())
-
-    # Apply override_orbs map
-    orb_map = getattr(overrides, 'override_orbs', {}) or {}
-    if orb_map:
-        new_aspects: List[AspectDefinition] = []
-        for a in m.aspect_definitions:
-            if a.id in orb_map:
-                new_aspects.append(AspectDefinition(id=a.id, glyph=a.glyph, angle=a.angle, default_orb=float(orb_map[a.id]), i18n=a.i18n))
-            else:
-                new_aspects.append(a)
-        m.aspect_definitions = new_aspects
 
-    return m
+def _effective_model_signature(model: AstroModel, overrides: ModelOverrides) -> tuple:
+    """Snapshot, by value, every input merge_model_with_overrides reads.
+    
+    Definitions are frozen and compare by identity first; settings and override
+    entries are mutable, so their field values are captured instead.
+    """
+    def _entries(entries: Any) -> tuple:
+        return tuple((oe.id, oe.glyph, oe.angle, oe.default_orb, oe.i18n) for oe in entries or ())
+
+    settings = getattr(getattr(model, 'settings', None), '__dict__', {})
+    return (
+        tuple(model.aspect_definitions),
+        tuple(model.body_definitions),
+        tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in settings.items()),
+        _entries(getattr(overrides, 'aspects', None)),
+        _entries(getattr(overrides, 'points', None)),
+        tuple((getattr(overrides, 'override_orbs', None) or {}).items()),
+    )
+
+
+def _get_effective_model(ws: Optional['Workspace']) -> Optional[AstroModel]:
+    """Active model of a workspace with its model_overrides applied, reused across calls.
+    
+    Returning the same merged instance while nothing changed also lets
+    resolve_effective_defaults (cached per model identity) hit its cache.
+    """
+    model = get_active_model(ws)
+    overrides = getattr(ws, 'model_overrides', None) if model is not None else None
+    if not overrides:
+        return model
+
+    signature = _effective_model_signature(model, overrides)
+    key = id(ws)
+    cached = _EFFECTIVE_MODEL_CACHE.get(key)
+    if cached is not None and cached[0] is model and cached[1] is overrides and cached[2] == signature:
+        _EFFECTIVE_MODEL_CACHE.move_to_end(key)
+        return cached[3]
+
+    merged = merge_model_with_overrides(model, overrides)
+    _EFFECTIVE_MODEL_CACHE[key] = (model, overrides, signature, merged)
+    if len(_EFFECTIVE_MODEL_CACHE) > _EFFECTIVE_MODEL_CACHE_SIZE:
+        _EFFECTIVE_MODEL_CACHE.popitem(last=False)
+    return merged
 
 
-def _build_aspect_orbs(model: AstroModel) -> Dict[str, float]:
+def _build_aspect_orbs(model: AstroModel) -> Mapping[str, float]:
     """Create a map aspect-id -> default orb from the model's aspect definitions.
     
     Args:
         model: AstroModel containing aspect definitions
         
     Returns:
-        Dictionary mapping aspect ID to default orb value
+        Read-only mapping of aspect ID to default orb value
     """
-    return {a.id: float(a.default_orb) for a in getattr(model, 'aspect_definitions', []) or []}
+    # AstroModel is unhashable, so key on identity and check the (frozen) definitions still match
+    definitions = tuple(getattr(model, 'aspect_definitions', []) or [])
+    cached = _ASPECT_ORBS_CACHE.get(id(model))
+    if cached is not None and cached[0] == definitions:
+        _ASPECT_ORBS_CACHE.move_to_end(id(model))
+        return cached[1]
+
+    orbs = MappingProxyType({a.id: float(a.default_orb) for a in definitions})
+    _ASPECT_ORBS_CACHE[id(model)] = (definitions, orbs)
+    if len(_ASPECT_ORBS_CACHE) > _ASPECT_ORBS_CACHE_SIZE:
+        _ASPECT_ORBS_CACHE.popitem(last=False)
+    return orbs
 
 
 def get_active_model(ws: Optional['Workspace']) -> Optional[AstroModel]:
@@ -1369,23 +1730,51 @@ def get_active_model(ws: Optional['Workspace']) -> Optional[AstroModel]:
     """
     if ws is None:
         return None
-    models = getattr(ws, 'models', {}) or {}
+    models = getattr(ws, 'models', None)
     if not models:
         return None
-    # Get active model name
-    name = getattr(ws, 'active_model', None)
-    if name and name in models:
-        return models[name]
-    # Fallback: return first available model
-    try:
-        return next(iter(models.values()))
-    except StopIteration:
-        return None
+    # Active model by name in one lookup; fallback: first available model
+    # (models is non-empty here, so next() cannot raise)
+    model = models.get(getattr(ws, 'active_model', None))
+    return model if model is not None else next(iter(models.values()))
+
+
+def _effective_defaults_signature(ws: 'Workspace', model: AstroModel) -> tuple:
+    """Snapshot every input read by resolve_effective_defaults.
+    
+    Workspaces and models are mutated in place by the UIs, so cached results are
+    only reused while this snapshot still compares equal.
+    """
+    ms = getattr(model, 'settings', None)
+    d = getattr(ws, 'default', None) if ws is not None else None
+
+    def _seq(value: Any) -> Optional[tuple]:
+        return tuple(value) if value else None
+
+    return (
+        getattr(d, 'default_house_system', None),
+        _seq(getattr(d, 'default_bodies', None)),
+        _seq(getattr(d, 'observable_objects', None)),
+        _seq(getattr(d, 'default_aspects', None)),
+        getattr(d, 'ephemeris_engine', None),
+        _seq(getattr(ws, 'aspects', None) if ws is not None else None),
+        getattr(ms, 'default_house_system', None),
+        _seq(getattr(ms, 'default_bodies', None)),
+        _seq(getattr(ms, 'default_aspects', None)),
+        getattr(ms, 'standard_orb', None),
+        getattr(model, 'engine', None),
+        getattr(model, 'zodiac_type', None),
+        getattr(model, 'ayanamsa', None),
+        _seq(getattr(model, 'aspect_definitions', None)),
+    )
 
 
 def resolve_effective_defaults(ws: 'Workspace', model: Optional[AstroModel]) -> Dict[str, object]:
     """Resolve effective defaults merging workspace overrides on top of AstroModel settings.
     
+    Results are cached per (workspace, model) identity and reused while the inputs
+    they were built from are unchanged.
+    
     Args:
         ws: Workspace containing default overrides
         model: Optional AstroModel with base settings
@@ -1394,9 +1783,31 @@ def resolve_effective_defaults(ws: 'Workspace', model: Optional[AstroModel]) ->
         Dictionary with keys: house_system, bodies, aspects, standard_orb, engine,
         zodiac_type, ayanamsa, aspect_orbs, observable_objects
     """
-    out: Dict[str, object] = {}
     if model is None:
-        return out
+        return {}
+
+    cache_key = (id(ws), id(model))
+    signature = _effective_defaults_signature(ws, model)
+    cached = _EFFECTIVE_DEFAULTS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        _EFFECTIVE_DEFAULTS_CACHE.move_to_end(cache_key)
+        return _copy_effective_defaults(cached[1])
+
+    out = _resolve_effective_defaults_uncached(ws, model)
+    _EFFECTIVE_DEFAULTS_CACHE[cache_key] = (signature, out)
+    if len(_EFFECTIVE_DEFAULTS_CACHE) > _EFFECTIVE_DEFAULTS_CACHE_SIZE:
+        _EFFECTIVE_DEFAULTS_CACHE.popitem(last=False)
+    return _copy_effective_defaults(out)
+
+
+def _copy_effective_defaults(defaults: Dict[str, object]) -> Dict[str, object]:
+    """Copy a cached defaults dict, including its lists, so callers may mutate the result."""
+    return {k: list(v) if isinstance(v, list) else v for k, v in defaults.items()}
+
+
+def _resolve_effective_defaults_uncached(ws: 'Workspace', model: AstroModel) -> Dict[str, object]:
+    """Resolve effective defaults for resolve_effective_defaults without consulting its cache."""
+    out: Dict[str, object] = {}
 
     ms = getattr(model, 'settings', None)
     d = getattr(ws, 'default', None) if ws is not None else None
@@ -1410,9 +1821,9 @@ def resolve_effective_defaults(ws: 'Workspace', model: Optional[AstroModel]) ->
 
     # Observable objects (extends bodies with angles, houses, etc.)
     ws_observable = getattr(d, 'observable_objects', None) if d else None
-    # Merge with bodies if both exist
+    # Merge with bodies if both exist (ordered dedup: bodies first, then extras)
     if ws_observable:
-        combined = list(set((out.get('bodies') or []) + ws_observable))
+        combined = list(dict.fromkeys(chain(out.get('bodies') or (), ws_observable)))
         out['observable_objects'] = combined
     else:
         out['observable_objects'] = out.get('bodies') or []
@@ -1439,7 +1850,8 @@ def resolve_effective_defaults(ws: 'Workspace', model: Optional[AstroModel]) ->
 
 
 def compute_positions(engine: Optional[EngineType], name: str, dt_str: str, loc_str: str,
-                      ephemeris_path: Optional[str] = None, requested_objects: Optional[List[str]] = None) -> Dict[str, Union[float, Dict[str, float]]]:
+                      ephemeris_path: Optional[str] = None, requested_objects: Optional[Collection[str]] = None,
+                      event_dt: Optional[datetime] = None) -> Dict[str, Union[float, Dict[str, float]]]:
     """Dispatch position computation based on engine.
     - For EngineType.JPL, returns a dict of ecliptic longitudes using Skyfield and a local ephemeris file.
     - For other or None, returns Kerykeion observable object longitudes (degrees) as a dict.
@@ -1451,6 +1863,8 @@ def compute_positions(engine: Optional[EngineType], name: str, dt_str: str, loc_
         loc_str: Location string
         ephemeris_path: Optional path to ephemeris file
         requested_objects: Optional list of object IDs to compute (filters results)
+        event_dt: Optional already-parsed event time; when given it is used instead
+            of dt_str, so no string formatting or parsing happens
     
     Returns:
         Dict mapping object_id -> ecliptic_longitude (degrees) or extended dict.
@@ -1460,59 +1874,100 @@ def compute_positions(engine: Optional[EngineType], name: str, dt_str: str, loc_
         ValueError: If datetime or location cannot be parsed
         FileNotFoundError: If ephemeris file is specified but not found
     """
-    if engine == EngineType.JPL:
-        result = compute_jpl_positions(name, dt_str, loc_str, ephemeris_path=ephemeris_path, requested_objects=requested_objects)
-        # Ensure we return a dict, not a string
-        if isinstance(result, dict):
-            # For JPL, we only get planets; angles/houses need kerykeion fallback
-            jpl_positions = result
-            
-            # If requested objects include non-planets, fall through to kerykeion
-            non_planet_objects = []
-            if requested_objects:
-                jpl_planets = ["sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto"]
-                non_planet_objects = [obj for obj in requested_objects if obj not in jpl_planets]
-            
-            if non_planet_objects:
-                # Get additional objects from kerykeion
-                try:
-                    subj = compute_subject(name, dt_str, loc_str)
-                    # Get model for constants (degrees_in_circle)
-                    model = None
-                    model = get_active_model(None)
-                    kerykeion_positions = _extract_kerykeion_observable_objects(subj, requested_objects=non_planet_objects, model=model)
-                    jpl_positions.update(kerykeion_positions)
-                except (ValueError, AttributeError, KeyError) as e:
-                    logger.warning("Could not compute non-planet objects with Kerykeion: %s", e)
-            
-            return jpl_positions
-        else:
-            # If JPL failed, fall through to Kerykeion
-            pass
+    # utils.Actual accepts datetimes directly, so the parsed value is passed through as-is
+    time_input = event_dt if event_dt is not None else dt_str
+    cacheable = _is_fixed_time(time_input)
+    if cacheable:
+        cache_key = (
+            engine,
+            name,
+            time_input,
+            loc_str,
+            ephemeris_path,
+            frozenset(requested_objects) if requested_objects else None,
+        )
+        cached = _POSITIONS_CACHE.get(cache_key)
+        if cached is not None:
+            _POSITIONS_CACHE.move_to_end(cache_key)
+            return _copy_positions(cached)
+    
+    positions = _compute_positions_uncached(engine, name, time_input, loc_str, ephemeris_path, requested_objects)
+    
+    # Empty results signal a failure worth retrying, so only cache real data
+    if cacheable and positions:
+        _POSITIONS_CACHE[cache_key] = _copy_positions(positions)
+        if len(_POSITIONS_CACHE) > _POSITIONS_CACHE_SIZE:
+            _POSITIONS_CACHE.popitem(last=False)
+    return positions
+
+
+def _compute_positions_uncached(engine: Optional[EngineType], name: str, dt_str: str, loc_str: str,
+                                ephemeris_path: Optional[str] = None,
+                                requested_objects: Optional[Collection[str]] = None) -> Dict[str, Union[float, Dict[str, float]]]:
+    """Compute positions for compute_positions without consulting its result cache."""
+    handler = _ENGINE_DISPATCH.get(engine, _compute_kerykeion_positions)
+    return handler(name, dt_str, loc_str, ephemeris_path, requested_objects)
+
+
+def _compute_jpl_positions_with_fallback(name: str, dt_str: str, loc_str: str,
+                                         ephemeris_path: Optional[str] = None,
+                                         requested_objects: Optional[Collection[str]] = None) -> Dict[str, Union[float, Dict[str, float]]]:
+    """JPL engine handler: Skyfield planets, Kerykeion for the rest, Kerykeion entirely if JPL fails."""
+    result = compute_jpl_positions(name, dt_str, loc_str, ephemeris_path=ephemeris_path, requested_objects=requested_objects)
+    # Ensure we return a dict, not a string; if JPL failed, fall back to Kerykeion
+    if not isinstance(result, dict):
+        return _compute_kerykeion_positions(name, dt_str, loc_str, ephemeris_path, requested_objects)
+
+    # For JPL, we only get planets; angles/houses need kerykeion fallback
+    jpl_positions = result
+    
+    # If requested objects include non-planets, fall through to kerykeion
+    non_planet_objects = []
+    if requested_objects:
+        non_planet_objects = [obj for obj in requested_objects if obj not in _JPL_SUPPORTED_SET]
+    
+    if non_planet_objects:
+        # Get additional objects from kerykeion
+        try:
+            subj = _compute_subject_for_positions(name, dt_str, loc_str)
+            # Get model for constants (degrees_in_circle)
+            model = get_active_model(None)
+            kerykeion_positions = _extract_kerykeion_observable_objects(subj, requested_objects=non_planet_objects, model=model)
+            jpl_positions.update(kerykeion_positions)
+        except (ValueError, AttributeError, KeyError) as e:
+            logger.warning("Could not compute non-planet objects with Kerykeion: %s", e)
+    
+    return jpl_positions
+
+
+def _compute_kerykeion_positions(name: str, dt_str: str, loc_str: str,
+                                 ephemeris_path: Optional[str] = None,
+                                 requested_objects: Optional[Collection[str]] = None) -> Dict[str, Union[float, Dict[str, float]]]:
+    """Kerykeion/Swiss Ephemeris engine handler (also the default for unknown engines).
     
+    ephemeris_path is accepted for a uniform handler signature and ignored.
+    """
     # Kerykeion: extract all observable objects
     try:
-        subj = compute_subject(name, dt_str, loc_str)
+        subj = _compute_subject_for_positions(name, dt_str, loc_str)
         # Try using Subject wrapper's data() method first (it knows how to access planets_list)
         positions = {}
-        mapping = _get_kerykeion_object_mapping()
+        mapping = _KERYKEION_OBJECT_MAPPING
+        requested_set = frozenset(requested_objects) if requested_objects else None
         try:
-            subject_wrapper = Subject(name)
-            subject_wrapper.computed = subj
-            object_list, degrees_list, labels = subject_wrapper.data()
+            object_list, degrees_list, labels = _subject_data(subj)
             # If we got data from Subject.data(), use it
             if object_list and degrees_list and len(object_list) == len(degrees_list):
                 for i, obj_name in enumerate(object_list):
                     if i < len(degrees_list):
-                        obj_id = mapping.get(obj_name.lower(), obj_name.lower())
-                        if requested_objects and obj_id not in requested_objects and obj_name.lower() not in requested_objects:
+                        obj_name_lower = obj_name.lower()
+                        obj_id = mapping.get(obj_name_lower, obj_name_lower)
+                        if requested_set is not None and obj_id not in requested_set and obj_name_lower not in requested_set:
                             continue
                         try:
                             # Normalize to [0, 360) range (same as JPL)
                             lon_float = float(degrees_list[i])
                             normalized_lon = lon_float % DEGREES_IN_CIRCLE
-                            if normalized_lon < 0:
-                                normalized_lon += DEGREES_IN_CIRCLE
                             positions[obj_id] = normalized_lon
                         except (ValueError, TypeError, IndexError) as e:
                             logger.debug("Failed to normalize position for %s: %s", obj_name, e)
@@ -1529,8 +1984,8 @@ def compute_positions(engine: Optional[EngineType], name: str, dt_str: str, loc_
         
         if not positions:
             positions = _extract_kerykeion_observable_objects(subj, requested_objects=requested_objects, model=model)
-            if not positions:
-                # Add diagnostic logging
+            if not positions and logger.isEnabledFor(logging.DEBUG):
+                # Diagnostics walk the subject, so only run them when DEBUG output is wanted
                 logger.debug("Direct extraction also failed. Checking Kerykeion subject attributes:")
                 logger.debug("  has planets_list: %s", hasattr(subj, 'planets_list'))
                 logger.debug("  has planets_degrees_ut: %s", hasattr(subj, 'planets_degrees_ut'))
@@ -1554,26 +2009,97 @@ def compute_positions(engine: Optional[EngineType], name: str, dt_str: str, loc_
         return positions
     except (ValueError, AttributeError, KeyError) as e:
         # Log specific errors for debugging
-        logger.error("Error computing positions with Kerykeion: %s", e, exc_info=True)
+        # Formatting the traceback is costly; only attach it when DEBUG output is wanted
+        logger.error("Error computing positions with Kerykeion: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {}
 
 
-def compute_swiss_positions_for_chart(
-    chart: ChartInstance,
-    ws: Optional['Workspace'] = None,
-) -> Dict[str, Union[float, Dict[str, float]]]:
-    """Compute Swiss/Kerykeion-backed chart positions through the backend seam."""
-    cfg = _safe_get_attr(chart, 'config')
+# Engine -> position handler; engines not listed here use _compute_kerykeion_positions
+_ENGINE_DISPATCH: Dict[Optional[EngineType], Callable[..., Dict[str, Union[float, Dict[str, float]]]]] = {
+    EngineType.JPL: _compute_jpl_positions_with_fallback,
+    EngineType.SWISSEPH: _compute_kerykeion_positions,
+    None: _compute_kerykeion_positions,
+}
+
+
+def compute_positions_batch(engine: Optional[EngineType], name: str, dt_list: List[Union[str, datetime]],
+                            loc_str: str, ephemeris_path: Optional[str] = None,
+                            requested_objects: Optional[Collection[str]] = None) -> Dict[str, np.ndarray]:
+    """Compute longitudes for a series of times at one location.
+    
+    For EngineType.JPL the planets are evaluated over all times in one vectorised
+    Skyfield call (compute_jpl_longitudes_batch); any other requested objects,
+    and every object for other engines, are computed per time via compute_positions.
+    As with compute_positions, JPL without requested_objects returns the JPL
+    planets only; pass angles and points explicitly to get them from Kerykeion.
+    
+    Args:
+        engine: Computation engine to use
+        name: Subject name
+        dt_list: Datetimes or datetime strings, one per sample
+        loc_str: Location string
+        ephemeris_path: Optional path to ephemeris file
+        requested_objects: Optional list of object IDs to compute (filters results);
+            None means every JPL planet for EngineType.JPL, everything for other engines
+    
+    Returns:
+        Dict mapping object_id -> array of longitudes (degrees) aligned with dt_list.
+        Samples where an object could not be computed are NaN.
+    """
+    n = len(dt_list)
+    if not n:
+        return {}
+
+    positions: Dict[str, np.ndarray] = {}
+    remaining = requested_objects
+    sample_engine = engine
+    if engine == EngineType.JPL and JPL:
+        positions = compute_jpl_longitudes_batch(dt_list, loc_str, ephemeris_path, requested_objects)
+        remaining = [obj for obj in requested_objects if obj not in positions] if requested_objects else []
+        if not remaining:
+            return positions
+        # Planets came from the vectorised path; angles and points need Kerykeion
+        sample_engine = None
+
+    for i, dt in enumerate(dt_list):
+        if isinstance(dt, datetime):
+            sample = compute_positions(sample_engine, name, '', loc_str, ephemeris_path, remaining, event_dt=dt)
+        else:
+            sample = compute_positions(sample_engine, name, dt, loc_str, ephemeris_path, remaining)
+        for obj_id, value in sample.items():
+            column = positions.get(obj_id)
+            if column is None:
+                column = positions[obj_id] = np.full(n, np.nan)
+            column[i] = value['longitude'] if isinstance(value, dict) else value
+    return positions
+
 
+def _resolve_requested_objects(chart: ChartInstance, ws: Optional['Workspace']) -> Optional[List[str]]:
+    """Observable objects to compute for a chart.
+    
+    Prefers the chart config, then the workspace/model defaults (cached by
+    resolve_effective_defaults). Returns None, meaning "compute everything",
+    when neither specifies any or the workspace defaults cannot be resolved.
+    """
+    cfg = _safe_get_attr(chart, 'config')
     requested_objects = _safe_get_attr(cfg, 'observable_objects') if cfg else None
     if not requested_objects and ws:
         try:
             model = get_active_model(ws)
             if model:
-                eff = resolve_effective_defaults(ws, model)
-                requested_objects = eff.get('observable_objects')
+                requested_objects = resolve_effective_defaults(ws, model).get('observable_objects')
         except (AttributeError, KeyError, TypeError) as e:
+            # Log but don't fail - use None as fallback (will compute all objects)
             logger.warning("Could not resolve observable objects from workspace: %s", e)
+    return requested_objects or None
+
+
+def compute_swiss_positions_for_chart(
+    chart: ChartInstance,
+    ws: Optional['Workspace'] = None,
+) -> Dict[str, Union[float, Dict[str, float]]]:
+    """Compute Swiss/Kerykeion-backed chart positions through the backend seam."""
+    requested_objects = _resolve_requested_objects(chart, ws)
 
     name, dt_str, loc_str = _extract_chart_compute_inputs(chart)
     return compute_positions(
@@ -1594,17 +2120,7 @@ def compute_jpl_positions_for_chart(
     ephemeris_path: Optional[str] = None,
 ) -> Dict[str, Union[float, Dict[str, float]]]:
     """Compute JPL-backed chart positions through the backend seam."""
-    cfg = _safe_get_attr(chart, 'config')
-
-    requested_objects = _safe_get_attr(cfg, 'observable_objects') if cfg else None
-    if not requested_objects and ws:
-        try:
-            model = get_active_model(ws)
-            if model:
-                eff = resolve_effective_defaults(ws, model)
-                requested_objects = eff.get('observable_objects')
-        except (AttributeError, KeyError, TypeError) as e:
-            logger.warning("Could not resolve observable objects from workspace: %s", e)
+    requested_objects = _resolve_requested_objects(chart, ws)
 
     name, dt_str, loc_str = _extract_chart_compute_inputs(chart)
     result = compute_jpl_positions(
@@ -1619,12 +2135,11 @@ def compute_jpl_positions_for_chart(
     )
 
     if requested_objects:
-        jpl_planets = ["sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto"]
-        non_planet_objects = [obj for obj in requested_objects if obj not in jpl_planets]
+        non_planet_objects = [obj for obj in requested_objects if obj not in _JPL_SUPPORTED_SET]
 
         if non_planet_objects:
             try:
-                subj = compute_subject(name, dt_str, loc_str)
+                subj = _compute_subject_for_positions(name, dt_str, loc_str)
                 model = get_active_model(ws)
                 kerykeion_positions = _extract_kerykeion_observable_objects(
                     subj,
@@ -1642,42 +2157,32 @@ def compute_jpl_positions_for_chart(
 
 def _extract_chart_compute_inputs(chart: ChartInstance) -> tuple[str, str, str]:
     """Extract canonical compute inputs from a chart object."""
-    subj = _safe_get_attr(chart, 'subject')
+    subj = chart.get('subject') if isinstance(chart, dict) else getattr(chart, 'subject', None)
     if subj is None:
         raise ValueError("Chart has no subject")
 
-    name = _safe_get_attr(subj, 'name')
+    # One attrgetter call for the common ChartSubject case; dicts and partial objects handled inside
+    name, event_time, loc = _subject_fields(subj)
     if not name:
-        if isinstance(subj, dict):
-            name = subj.get('name') or subj.get('id') or 'chart'
-        else:
-            name = 'chart'
+        name = (subj.get('id') if isinstance(subj, dict) else None) or 'chart'
 
-    event_time = _safe_get_attr(subj, 'event_time')
     if event_time is None:
         raise ValueError(f"Chart subject has no event_time (subject type: {type(subj)})")
     if isinstance(event_time, datetime):
         dt_str = event_time.isoformat()
+    elif isinstance(event_time, str):
+        dt_str = event_time
     else:
         dt_str = str(event_time)
 
-    loc = _safe_get_attr(subj, 'location')
     if loc is None:
         raise ValueError("Chart subject has no location")
 
-    lat = _safe_get_attr(loc, 'latitude')
-    lon = _safe_get_attr(loc, 'longitude')
-    if lat is None and isinstance(loc, dict):
-        lat = loc.get('latitude')
-    if lon is None and isinstance(loc, dict):
-        lon = loc.get('longitude')
-
+    lat, lon, loc_name = _location_fields(loc)
     if lat is not None and lon is not None:
         loc_str = f"{lat},{lon}"
     else:
-        loc_str = _safe_get_attr(loc, 'name')
-        if not loc_str and isinstance(loc, dict):
-            loc_str = loc.get('name') or ''
+        loc_str = loc_name or ''
 
     if not loc_str:
         raise ValueError(f"Could not determine location name (location type: {type(loc)})")
@@ -1769,6 +2274,43 @@ def compute_chart_data_for_chart(
 # 📦 HIGHER-LEVEL APP SERVICES (UI-agnostic)
 # ─────────────────────
 
+@lru_cache(maxsize=512)
+def _parse_chart_datetime_cached(dt_str: str) -> datetime:
+    """Parse an absolute datetime string, memoised on the exact string.
+    
+    Raises ValueError for unparseable input, which lru_cache does not store.
+    """
+    return _parse_date_string(dt_str)
+
+
+@lru_cache(maxsize=512)
+def _parse_chart_location_cached(loc_text: str) -> Optional[Location]:
+    """Actual(loc_text, t="loc").to_model_location() memoised on the exact string."""
+    return _parse_place_cached(loc_text).to_model_location()
+
+
+def _parse_chart_datetime(dt_str: str) -> datetime:
+    """Parse a chart datetime, reusing earlier parses of the same absolute string.
+    
+    Relative or empty strings ("now", "today", "") resolve against the current
+    time, so they are always parsed afresh.
+    """
+    if not isinstance(dt_str, str) or dt_str.strip().lower() in _VOLATILE_DATE_STRINGS:
+        return Actual(dt_str, t="date").value
+    try:
+        return _parse_chart_datetime_cached(dt_str)
+    except (ValueError, TypeError, OverflowError):
+        # Let Actual apply its usual fallback (current time) without caching it
+        return Actual(dt_str, t="date").value
+
+
+def _parse_chart_location(loc_text: str) -> Optional[Location]:
+    """Resolve a chart location, reusing earlier lookups (geocoding, timezone) of the same text."""
+    if not isinstance(loc_text, str):
+        return Actual(loc_text, t="loc").to_model_location()
+    return _parse_chart_location_cached(loc_text)
+
+
 def build_chart_instance(name: str, dt_str: str, loc_text: str,
                          mode: ChartMode, ws: Optional[Workspace] = None, 
                          ephemeris_path: Optional[str] = None) -> ChartInstance:
@@ -1782,7 +2324,7 @@ def build_chart_instance(name: str, dt_str: str, loc_text: str,
     zodiac_type = None
     included_points: List[str] = []
     observable_objects: Optional[List[str]] = None
-    aspect_orbs: Dict[str, float] = {}
+    aspect_orbs: Mapping[str, float] = {}
     ayanamsa = None
 
     if ws is not None:
@@ -1794,15 +2336,14 @@ def build_chart_instance(name: str, dt_str: str, loc_text: str,
             pass
         # Resolve effective defaults from active model
         try:
-            model = get_active_model(ws)
-            if model is not None:
-                eff_model = merge_model_with_overrides(model, getattr(ws, 'model_overrides', None))
+            eff_model = _get_effective_model(ws)
+            if eff_model is not None:
                 eff = resolve_effective_defaults(ws, eff_model)
                 house = eff.get('house_system') or house
                 zodiac_type = eff.get('zodiac_type') or zodiac_type
                 included_points = list(eff.get('bodies') or [])
                 observable_objects = list(eff.get('observable_objects') or [])
-                aspect_orbs = dict(eff.get('aspect_orbs') or {})
+                aspect_orbs = eff.get('aspect_orbs') or {}
                 ayanamsa = eff.get('ayanamsa') or ayanamsa
                 # If workspace default specifies engine, that already took priority above; otherwise use model engine
                 engine = engine or eff.get('engine')
@@ -1812,8 +2353,8 @@ def build_chart_instance(name: str, dt_str: str, loc_text: str,
  
     # Normalize inputs via utils.Actual and to_model_location
     try:
-        t = Actual(dt_str, t="date").value
-        loc_model = Actual(loc_text, t="loc").to_model_location()
+        t = _parse_chart_datetime(dt_str)
+        loc_model = _parse_chart_location(loc_text)
     except (ValueError, AttributeError) as e:
         raise ValueError(f"Failed to parse date or location: {e}") from e
     
@@ -1837,7 +2378,8 @@ def build_chart_instance(name: str, dt_str: str, loc_text: str,
         if observable_objects:
             chart.config.observable_objects = observable_objects
         if aspect_orbs:
-            chart.config.aspect_orbs = aspect_orbs
+            # The resolved defaults are a shared read-only mapping; give the chart its own dict
+            chart.config.aspect_orbs = dict(aspect_orbs)
         if engine is not None:
             chart.config.engine = engine
         if ayanamsa is not None:
@@ -1848,6 +2390,38 @@ def build_chart_instance(name: str, dt_str: str, loc_text: str,
     return chart
 
 
+# C-level attribute fetchers for the per-chart loops below
+_SUBJECT_FIELDS = attrgetter('name', 'event_time', 'location')
+_LOCATION_FIELDS = attrgetter('latitude', 'longitude', 'name')
+
+
+def _subject_fields(subj: Any) -> Tuple[Any, Any, Any]:
+    """Return (name, event_time, location) of a chart subject, tolerating dicts and partial objects."""
+    if not subj:
+        return '', None, None
+    if isinstance(subj, dict):
+        return subj.get('name', ''), subj.get('event_time'), subj.get('location')
+    try:
+        return _SUBJECT_FIELDS(subj)
+    except AttributeError:
+        return getattr(subj, 'name', ''), getattr(subj, 'event_time', None), getattr(subj, 'location', None)
+
+
+def _location_fields(loc: Any) -> Tuple[Any, Any, Any]:
+    """Return (latitude, longitude, name) of a subject location, tolerating dicts and partial objects."""
+    if isinstance(loc, dict):
+        return loc.get('latitude'), loc.get('longitude'), loc.get('name')
+    try:
+        return _LOCATION_FIELDS(loc)
+    except AttributeError:
+        return getattr(loc, 'latitude', None), getattr(loc, 'longitude', None), getattr(loc, 'name', None)
+
+
+def _ws_charts(ws: Optional[Workspace]) -> Sequence[ChartInstance]:
+    """Return ws.charts, or an empty tuple when there is no workspace or it has no charts."""
+    return (getattr(ws, 'charts', None) if ws else None) or ()
+
+
 def find_chart_by_name_or_id(ws: Optional[Workspace], name_or_id: str) -> Optional[ChartInstance]:
     """Find a chart in the workspace by subject name or chart ID.
     
@@ -1858,95 +2432,194 @@ def find_chart_by_name_or_id(ws: Optional[Workspace], name_or_id: str) -> Option
     Returns:
         ChartInstance if found, None otherwise
     """
-    if not ws or not getattr(ws, 'charts', None):
+    charts = _ws_charts(ws)
+    if not charts:
         return None
     key = (name_or_id or '').strip()
-    for c in ws.charts:
-        subj = getattr(c, 'subject', None)
-        cid = getattr(c, 'id', None)
-        nm = getattr(subj, 'name', None) if subj else None
-        if key and (key == nm or key == cid):
+    if not key:
+        return None
+    # Index hit: verify the chart at that position still carries the key
+    pos = _chart_index(ws, charts).get(key)
+    if pos is not None and pos < len(charts) and _chart_matches(charts[pos], key):
+        return charts[pos]
+    # Miss or stale entry (charts renamed/replaced in place): scan, then refresh the index
+    for c in charts:
+        if _chart_matches(c, key):
+            _build_chart_index(ws, charts)
             return c
     return None
 
 
-def search_charts(ws: Optional[Workspace], query: str) -> List[ChartInstance]:
-    """Search charts in workspace using case-insensitive text matching.
+def _chart_matches(c: ChartInstance, key: str) -> bool:
+    """True when key equals the chart id or its subject name."""
+    return key == getattr(c, 'id', None) or key == _subject_fields(getattr(c, 'subject', None))[0]
+
+
+def _chart_index(ws: Workspace, charts: List[ChartInstance]) -> Dict[str, int]:
+    """Return the name/id -> position index for ws.charts, building it when the list changed identity."""
+    cached = _CHART_INDEX_CACHE.get(id(ws))
+    if cached is not None and cached[0] is charts:
+        _CHART_INDEX_CACHE.move_to_end(id(ws))
+        return cached[1]
+    return _build_chart_index(ws, charts)
+
+
+def _build_chart_index(ws: Workspace, charts: List[ChartInstance]) -> Dict[str, int]:
+    """Index charts by id and subject name; the first chart wins, as in a linear scan."""
+    index: Dict[str, int] = {}
+    for pos, c in enumerate(charts):
+        for k in (getattr(c, 'id', None), _subject_fields(getattr(c, 'subject', None))[0]):
+            if k and isinstance(k, str):
+                index.setdefault(k, pos)
+    _CHART_INDEX_CACHE[id(ws)] = (charts, index)
+    if len(_CHART_INDEX_CACHE) > _CHART_INDEX_CACHE_SIZE:
+        _CHART_INDEX_CACHE.popitem(last=False)
+    return index
+
+
+def _chart_view(ch: ChartInstance) -> Tuple[Tuple[str, str, str, str, str], str, str]:
+    """Return the Open view row fields and both lowercased search texts for a chart.
     
-    Searches across chart name, event_time, location name, and tags.
+    Both are derived from the same subject/config/tags lookups, so list_open_view_rows
+    and search_charts share one entry per chart identity. The entry is rebuilt whenever
+    the subject, its name, event time or location, the chart mode or the tags change.
+    
+    Returns:
+        ((name, chart_type, event_time, location, tags), search_charts haystack,
+        OpenViewRow.search_text)
+    """
+    subj = getattr(ch, 'subject', None)
+    name, event_time, loc = _subject_fields(subj)
+    mode = getattr(getattr(ch, 'config', None), 'mode', None)
+    tags = tuple(getattr(ch, 'tags', []) or [])
+    fingerprint = (subj, name, event_time, loc, mode, tags)
+
+    cached = _CHART_VIEW_CACHE.get(id(ch))
+    if cached is not None and cached[0] == fingerprint:
+        _CHART_VIEW_CACHE.move_to_end(id(ch))
+        return cached[1], cached[2], cached[3]
+
+    name = str(name or '')
+    event_time = str(event_time or '')
+    location_name = str(getattr(loc, 'name', '') or '') if loc else ''
+    tag_strs = [str(t) for t in tags]
+    chart_type = str(getattr(mode, 'value', mode)) if mode else ''
+    fields = (name, chart_type, event_time, location_name, ", ".join(tag_strs))
+    # Lowercase each field once and assemble both haystacks from the lowered parts
+    name_lc, type_lc, time_lc, loc_lc = name.lower(), chart_type.lower(), event_time.lower(), location_name.lower()
+    tags_lc = [t.lower() for t in tag_strs]
+    text = f"{name_lc} {time_lc} {loc_lc} {','.join(tags_lc)}"
+    row_text = f"{name_lc} {type_lc} {time_lc} {loc_lc} {', '.join(tags_lc)}"
+    _CHART_VIEW_CACHE[id(ch)] = (fingerprint, fields, text, row_text)
+    if len(_CHART_VIEW_CACHE) > _CHART_VIEW_CACHE_SIZE:
+        _CHART_VIEW_CACHE.popitem(last=False)
+    return fields, text, row_text
+
+
+def iter_search_charts(ws: Optional[Workspace], query: str) -> Iterator[ChartInstance]:
+    """Lazily yield charts in workspace matching a case-insensitive text query.
+    
+    Searches across chart name, event_time, location name, and tags. Iteration
+    stops as soon as the caller stops consuming, so paging over the first few
+    hits does not scan the whole workspace.
     
     Args:
         ws: Workspace to search in
         query: Search query string
         
-    Returns:
-        List of ChartInstance objects matching the query
+    Yields:
+        ChartInstance objects matching the query, in workspace order
     """
-    if not ws or not getattr(ws, 'charts', None):
-        return []
+    charts = _ws_charts(ws)
     q = (query or '').strip().lower()
     if not q:
-        return list(ws.charts)
-    out: List[ChartInstance] = []
-    for ch in ws.charts:
+        yield from charts
+        return
+    for ch in charts:
         try:
-            subj = getattr(ch, 'subject', None)
-            loc = getattr(subj, 'location', None) if subj else None
-            tags = getattr(ch, 'tags', []) or []
-            hay = " ".join([
-                str(getattr(subj, 'name', '') or ''),
-                str(getattr(subj, 'event_time', '') or ''),
-                str(getattr(loc, 'name', '') or ''),
-                ",".join([str(t) for t in tags])
-            ]).lower()
-            if q in hay:
-                out.append(ch)
+            matched = q in _chart_view(ch)[1]
         except (AttributeError, TypeError):
             continue
-    return out
+        if matched:
+            yield ch
 
 
-def list_open_view_rows(ws: Optional[Workspace]) -> List[Dict[str, str]]:
+def search_charts(ws: Optional[Workspace], query: str, limit: Optional[int] = None) -> List[ChartInstance]:
+    """Search charts in workspace using case-insensitive text matching.
+    
+    Searches across chart name, event_time, location name, and tags.
+    
+    Args:
+        ws: Workspace to search in
+        query: Search query string
+        limit: Optional maximum number of matches to return (stops scanning early)
+        
+    Returns:
+        List of ChartInstance objects matching the query
+    """
+    return list(islice(iter_search_charts(ws, query), limit))
+
+
+class OpenViewRow(NamedTuple):
+    """One row of the Open view chart table; search_text is the lowercased filter haystack."""
+    name: str
+    chart_type: str
+    event_time: str
+    location: str
+    tags: str
+    search_text: str
+
+    @classmethod
+    def from_fields(cls, name: str, chart_type: str, event_time: str, location: str, tags: str) -> 'OpenViewRow':
+        """Build a row, deriving search_text from the display fields."""
+        search_text = f"{name} {chart_type} {event_time} {location} {tags}".lower()
+        return cls(name, chart_type, event_time, location, tags, search_text)
+
+
+def list_open_view_rows(ws: Optional[Workspace]) -> List[OpenViewRow]:
     """Produce table rows for Open view display.
     
     Args:
         ws: Workspace containing charts
         
     Returns:
-        List of dictionaries with keys: name, event_time, location, tags, search_text
+        List of OpenViewRow tuples (name, chart_type, event_time, location, tags, search_text);
+        use ``row._asdict()`` where a mapping is needed
     """
-    rows: List[Dict[str, str]] = []
-    if not ws or not getattr(ws, 'charts', None):
-        return rows
-    for ch in ws.charts:
+    rows: List[OpenViewRow] = []
+    for ch in _ws_charts(ws):
         try:
-            subj = getattr(ch, 'subject', None)
-            loc = getattr(subj, 'location', None) if subj else None
-            name = getattr(subj, 'name', '') if subj else ''
-            event_time = str(getattr(subj, 'event_time', '') or '')
-            location_name = getattr(loc, 'name', '') if loc else ''
-            tags = ", ".join(getattr(ch, 'tags', []) or [])
-            # Get chart type from config
-            cfg = getattr(ch, 'config', None)
-            chart_type = ''
-            if cfg:
-                mode = getattr(cfg, 'mode', None)
-                if mode:
-                    chart_type = mode.value if hasattr(mode, 'value') else str(mode)
-            search_text = f"{name} {chart_type} {event_time} {location_name} {tags}".lower()
-            rows.append({
-                'name': name,
-                'chart_type': chart_type,
-                'event_time': event_time,
-                'location': location_name,
-                'tags': tags,
-                'search_text': search_text,
-            })
+            fields, _, row_text = _chart_view(ch)
         except (AttributeError, TypeError):
             continue
+        rows.append(OpenViewRow(*fields, row_text))
     return rows
 
 
+_EMPTY_FIG_TEMPLATE = None
+
+
+def _empty_positions_figure() -> Any:
+    """Return the placeholder figure shown when no positions could be computed.
+    
+    The annotated template is built once; each call gets its own copy so callers
+    may still restyle the figure they receive.
+    """
+    global _EMPTY_FIG_TEMPLATE
+    if go is None:
+        raise ImportError("plotly is required to build radix figures")
+    if _EMPTY_FIG_TEMPLATE is None:
+        template = go.Figure()
+        template.add_annotation(
+            text="No positions computed. Check chart data and computation engine settings.",
+            xref="paper", yref="paper",
+            x=0.5, y=0.5, showarrow=False,
+            font=dict(size=16, color="red")
+        )
+        _EMPTY_FIG_TEMPLATE = template
+    return go.Figure(_EMPTY_FIG_TEMPLATE)
+
+
 def build_radix_figure_for_chart(chart: ChartInstance, engine_override: Optional[EngineType] = None, 
                                  ephemeris_path_override: Optional[str] = None, ws: Optional['Workspace'] = None) -> Any:
     """Extract positions from a ChartInstance's computed_chart and return a Plotly Figure ready to render.
@@ -1968,37 +2641,34 @@ def build_radix_figure_for_chart(chart: ChartInstance, engine_override: Optional
     # Use override engine if provided, otherwise use chart's stored engine
     if engine_override is not None or ephemeris_path_override is not None:
         # Get observable objects: prefer chart config, then workspace defaults, then model defaults
-        cfg = _safe_get_attr(chart, 'config')
-        requested_objects = _safe_get_attr(cfg, 'observable_objects') if cfg else None
-        if not requested_objects and ws:
-            try:
-                model = get_active_model(ws)
-                if model:
-                    eff = resolve_effective_defaults(ws, model)
-                    requested_objects = eff.get('observable_objects')
-            except (AttributeError, KeyError, TypeError) as e:
-                # Log but don't fail - use None as fallback (will compute all objects)
-                logger.warning("Could not resolve observable objects from workspace: %s", e)
+        requested_objects = _resolve_requested_objects(chart, ws)
+        # Hashable and O(1) membership for every filter (and cache key) downstream
+        requested_objects = frozenset(requested_objects) if requested_objects else None
         
-        subj = _safe_get_attr(chart, 'subject')
-        name = _safe_get_attr(subj, 'name') or 'chart'
-        event_time = _safe_get_attr(subj, 'event_time')
-        # Convert datetime to ISO format string for reliable parsing
-        if isinstance(event_time, datetime):
-            dt_str = event_time.isoformat()
+        # Fetch the subject chain once with plain attribute access (dicts only for legacy charts)
+        subj = chart.get('subject') if isinstance(chart, dict) else getattr(chart, 'subject', None)
+        name, event_time, loc = _subject_fields(subj)
+        name = name or 'chart'
+        # Datetimes are handed over as-is; only other values go through text parsing
+        event_dt = event_time if isinstance(event_time, datetime) else None
+        if event_dt is not None or not event_time:
+            dt_str = ''
+        elif isinstance(event_time, str):
+            dt_str = event_time
+        else:
+            dt_str = str(event_time)
+        if loc is None:
+            loc_str = ''
         else:
-            dt_str = str(event_time) if event_time else ''
-        loc = _safe_get_attr(subj, 'location')
-        loc_str = _safe_get_attr(loc, 'name') or '' if loc else ''
-        if not loc_str and loc:
-            lat = _safe_get_attr(loc, 'latitude')
-            lon = _safe_get_attr(loc, 'longitude')
-            if lat is not None and lon is not None:
-                loc_str = f"{lat},{lon}"
+            # Prefer the place name; only fall back to coordinates when it is missing
+            lat, lon, loc_str = _location_fields(loc)
+            if not loc_str:
+                loc_str = f"{lat},{lon}" if lat is not None and lon is not None else ''
         
         positions = compute_positions(engine_override, name, dt_str, loc_str, 
                                      ephemeris_path=ephemeris_path_override, 
-                                     requested_objects=requested_objects)
+                                     requested_objects=requested_objects,
+                                     event_dt=event_dt)
     else:
         positions = compute_positions_for_chart(chart, ws=ws)
     
@@ -2007,28 +2677,25 @@ def build_radix_figure_for_chart(chart: ChartInstance, engine_override: Optional
         # If no positions, log error and return empty figure with warning
         logger.error("build_radix_figure_for_chart got empty positions for chart %s", _safe_get_attr(chart, 'id', default='unknown'))
         # Return an empty figure rather than crashing
-        import plotly.graph_objects as go
-        empty_fig = go.Figure()
-        empty_fig.add_annotation(
-            text="No positions computed. Check chart data and computation engine settings.",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=16, color="red")
-        )
-        return empty_fig
+        return _empty_positions_figure()
     
-    values = list(positions.values())
-    # Check if all values are suspiciously close to 0 (within -5 to 5 degrees)
-    all_near_zero = all(abs(v) < 5.0 for v in values)
+    # Check if all values are suspiciously close to 0 (within -5 to 5 degrees).
+    # JPL extended results are dicts, so compare their longitude. Real charts
+    # almost always have a large value early, so stop at the first one.
+    all_near_zero = not any(
+        not (-5.0 < (v.get('longitude', math.nan) if isinstance(v, dict) else v) < 5.0)
+        for v in positions.values()
+    )
     if all_near_zero:
         # This suggests the computation might be using wrong parameters
         # But we'll still render it - the user can see the issue
-        import warnings
+        # warnings.warn stringifies its message even when filtered out, so keep it
+        # constant and leave the (large) positions dump to lazy DEBUG logging
         warnings.warn(
-            f"All computed positions are near 0° (within -5° to 5°). "
-            f"This may indicate incorrect time/location parameters. "
-            f"Positions: {positions}"
+            "All computed positions are near 0° (within -5° to 5°). "
+            "This may indicate incorrect time/location parameters."
         )
+        logger.debug("Near-zero positions: %s", positions)
     
     try:
         from module.z_visual import build_radix_figure
@@ -2037,9 +2704,5 @@ def build_radix_figure_for_chart(chart: ChartInstance, engine_override: Optional
     return build_radix_figure(positions)
 
 
-def compute_positions_for_inputs(engine: Optional[EngineType], name: str,
-                                 dt_str: str, loc_text: str,
-                                 ephemeris_path: Optional[str] = None,
-                                 requested_objects: Optional[List[str]] = None) -> Dict[str, float]:
-    """Thin wrapper over compute_positions to normalize/forward parameters from UI layers."""
-    return compute_positions(engine, name, dt_str, loc_text, ephemeris_path=ephemeris_path, requested_objects=requested_objects)
+# UI-facing name kept for compatibility; an alias avoids an extra call frame
+compute_positions_for_inputs = compute_positions
@@ -331,7 +331,7 @@ class DuckDBStorage:
         # PRE-INITIALIZE engine components ONCE (key optimization!)
         if engine_type == EngineType.JPL:
             try:
-                from skyfield.api import load, Topos, load_file
+                from skyfield.api import Topos
             except ImportError:
                 raise ImportError("skyfield is required for JPL engine")
             
@@ -339,21 +339,27 @@ class DuckDBStorage:
             if not ephemeris_file:
                 ephemeris_file = default_ephemeris_path()
             
-            # Pre-initialize Skyfield components
-            ts = load.timescale()
-            eph = load_file(ephemeris_file)
+            # Import position computation helpers
+            from module.services import (
+                _JPL_SUPPORTED, _compute_planet_extended_position,
+                _get_ephemeris, _get_jpl_body_handles, _get_timescale, _get_vernal_equinox_offset,
+            )
+
+            # Pre-initialize Skyfield components (shared with compute_positions)
+            ts = _get_timescale()
+            eph = _get_ephemeris(ephemeris_file)
             observer = Topos(latitude_degrees=location.latitude, longitude_degrees=location.longitude)
             is_de421 = "de421" in Path(ephemeris_file).name.lower()
             
-            # Import position computation helpers
-            from module.services import _compute_planet_extended_position, compute_vernal_equinox_offset
-            
             # Determine which planets to compute
-            jpl_supported = ["sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto"]
             if requested_objects:
-                planets = [p for p in jpl_supported if p in requested_objects]
+                requested_set = frozenset(requested_objects)
+                planets = [p for p in _JPL_SUPPORTED if p in requested_set]
             else:
-                planets = jpl_supported
+                planets = list(_JPL_SUPPORTED)
+            # Resolve body handles once (barycenters where the kernel needs them)
+            handles = _get_jpl_body_handles(eph, is_de421)
+            bodies = [(p, handles[p]) for p in planets if p in handles]
         else:
             # Kerykeion: Pre-compute subject template (location doesn't change)
             # Note: Kerykeion computes per-timestamp, but we avoid ChartInstance overhead
@@ -387,30 +393,20 @@ class DuckDBStorage:
                 # JPL: Use pre-initialized Skyfield components
                 t = ts.from_datetime(dt_aware)
                 
-                # Compute vernal equinox offset (for tropical zodiac)
-                year = dt_aware.year
-                vernal_equinox_offset = compute_vernal_equinox_offset(year, eph, observer, ts)
+                # Vernal equinox offset (for tropical zodiac), cached per year
+                vernal_equinox_offset = _get_vernal_equinox_offset(ephemeris_file, dt_aware.year, eph, observer, ts)
                 
-                # Compute positions directly using pre-initialized components
-                barycenter_planets = ["mars", "jupiter", "saturn", "uranus", "neptune", "pluto"]
+                # Compute positions directly using pre-initialized components;
+                # the observer position is shared by every planet at this time
+                observer_at_t = (eph["earth"] + observer).at(t)
                 positions = {}
-                for planet in planets:
+                for planet, body in bodies:
                     try:
-                        if is_de421 and planet in barycenter_planets:
-                            body = eph[f"{planet} barycenter"]
-                        else:
-                            try:
-                                body = eph[planet]
-                            except KeyError:
-                                if planet in barycenter_planets:
-                                    body = eph[f"{planet} barycenter"]
-                                else:
-                                    continue
-
                         pos = _compute_planet_extended_position(
                             body, eph, observer, t, vernal_equinox_offset,
                             include_physical=include_physical,
-                            include_topocentric=include_topocentric
+                            include_topocentric=include_topocentric,
+                            observer_at_t=observer_at_t,
                         )
                         if pos:
                             positions[planet] = pos
@@ -74,6 +74,8 @@ try:
 except ImportError:
     WEBVIEW_OK = False
 
+from collections.abc import Mapping
+from dataclasses import fields, is_dataclass
 from pathlib import Path
 
 # Optional storage integration (positions-only storage like Tauri flow).
@@ -605,11 +607,10 @@ class MyApp(MDApp):
 
     def _chart_to_dict(self, chart: ChartInstance) -> dict:
         # lightweight serialization for export
-        from dataclasses import asdict, is_dataclass
         def conv(o):
             if is_dataclass(o):
-                o = asdict(o)
-            if isinstance(o, dict):
+                o = {f.name: getattr(o, f.name) for f in fields(o)}
+            if isinstance(o, Mapping):
                 return {k: conv(v) for k, v in o.items()}
             if isinstance(o, list):
                 return [conv(x) for x in o]
@@ -1013,16 +1014,16 @@ class MyApp(MDApp):
             grid.add_widget(header)
             self._open_view_items = []
             for info in rows:
-                name = info.get('name', '')
-                event_time = info.get('event_time', '')
+                name = info.name
+                event_time = info.event_time
                 # Fallback to workspace default location if per-chart missing
                 try:
                     ws = getattr(self, 'workspace', None)
                     dl = getattr(getattr(ws, 'default_location', None), 'name', '') if ws else ''
                 except UI_RECOVERABLE_EXC:
                     dl = ''
-                location_name = info.get('location', '') or dl
-                tags = info.get('tags', '')
+                location_name = info.location or dl
+                tags = info.tags
                 row = GridLayout(cols=4, size_hint_y=None, height=32, spacing=6)
                 btn_name = self._md_button(name or '-', style='text', height=32)
                 btn_name.bind(on_release=lambda _b, nm=name: self._focus_chart_by_name(nm))
@@ -1030,7 +1031,6 @@ class MyApp(MDApp):
                 row.add_widget(MDLabel(text=str(event_time), theme_text_color="Primary"))
                 row.add_widget(MDLabel(text=str(location_name), theme_text_color="Primary"))
                 row.add_widget(MDLabel(text=str(tags), theme_text_color="Primary"))
-                row._search_text = info.get('search_text', '').lower()
                 grid.add_widget(row)
                 self._open_view_items.append(row)
         _render_rows(self._open_view_rows)
@@ -1043,7 +1043,7 @@ class MyApp(MDApp):
             if not q:
                 _render_rows(self._open_view_rows)
                 return
-            filtered = [r for r in self._open_view_rows if q in r.get('search_text','')]
+            filtered = [r for r in self._open_view_rows if q in r.search_text]
             _render_rows(filtered)
         search_inp.bind(text=_apply_filter)
 
@@ -40,9 +40,9 @@ except ImportError:
     )
 
 try:
-    from module.services import Subject, extract_kerykeion_points, compute_positions, list_open_view_rows
+    from module.services import OpenViewRow, Subject, extract_kerykeion_points, compute_positions, list_open_view_rows
 except ImportError:
-    from services import Subject, extract_kerykeion_points, compute_positions, list_open_view_rows
+    from services import OpenViewRow, Subject, extract_kerykeion_points, compute_positions, list_open_view_rows
 
 try:
     from module.z_visual import build_radix_figure
@@ -780,7 +780,7 @@ def _open_view_center():
             if not name:
                 continue
             # Check if already in rows (avoid duplicates)
-            if any(r.get('name') == name for r in rows):
+            if any(r.name == name for r in rows):
                 continue
             
             # Get chart type from config
@@ -797,22 +797,14 @@ def _open_view_center():
             location_name = locd.get('name', '') if locd else ''
             tags_list = _safe_get(ch, 'tags') or []
             tags = ", ".join(tags_list) if isinstance(tags_list, list) else str(tags_list)
-            search_text = f"{name} {chart_type} {event_time_str} {location_name} {tags}".lower()
-            rows.append({
-                'name': name,
-                'chart_type': chart_type,
-                'event_time': event_time_str,
-                'location': location_name,
-                'tags': tags,
-                'search_text': search_text,
-            })
+            rows.append(OpenViewRow.from_fields(name, chart_type, event_time_str, location_name, tags))
         except UI_RECOVERABLE_EXC:
             continue
     
     # Filter by search query
     q = (st.session_state.get('open_search') or '').strip().lower()
     if q:
-        rows = [r for r in rows if q in (r.get('search_text','').lower())]
+        rows = [r for r in rows if q in r.search_text]
 
     # Header
     hc1, hc2, hc3, hc4, hc5 = st.columns([2,1.5,2,1.5,2])
@@ -824,11 +816,11 @@ def _open_view_center():
 
     # Rows
     for info in rows:
-        name = info.get('name','-')
-        chart_type = info.get('chart_type','-')
-        event_time = info.get('event_time','')
-        location_name = info.get('location','')
-        tags = info.get('tags','')
+        name = info.name
+        chart_type = info.chart_type
+        event_time = info.event_time
+        location_name = info.location
+        tags = info.tags
         c1, c2, c3, c4, c5 = st.columns([2,1.5,2,1.5,2])
         with c1:
             if st.button(name or '-', key=f"open_row_{name}"):
@@ -1,6 +1,6 @@
 # utils.py
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from datetime import datetime, date, time, timedelta
 from dateutil.parser import parse
 from enum import Enum
@@ -8,10 +8,11 @@ from geopy.geocoders import Nominatim
 from geopy.location import Location as GeoLocation
 from geopy.exc import GeopyError
 import math
+import numpy as np
 import pytz
 from re import match
 from timezonefinder import TimezoneFinder
-from typing import Optional, Union, List, Tuple, Dict, Any
+from typing import Optional, Union, List, Tuple, Dict, Any, Mapping
 from pathlib import Path
 import yaml
 import json
@@ -23,14 +24,14 @@ try:
     from module.models import (
         AspectDefinition, AstroModel, BodyDefinition, DateRange, HouseSystem, ChartConfig, ChartInstance, ChartSubject,
         Location, ModelSettings, Sign, ChartMode, EngineType, ZodiacType, Ayanamsa,
-        Workspace, EphemerisSource, WorkspaceDefaults
+        Workspace, EphemerisSource, WorkspaceDefaults, to_epoch_ns
     )
 except ImportError:
     # For running directly (e.g. python3 module/utils.py)
     from models import (
         AspectDefinition, AstroModel, BodyDefinition, DateRange, HouseSystem, ChartConfig, ChartInstance, ChartSubject,
         Location, ModelSettings, Sign, ChartMode, EngineType, ZodiacType, Ayanamsa,
-        Workspace, EphemerisSource, WorkspaceDefaults
+        Workspace, EphemerisSource, WorkspaceDefaults, to_epoch_ns
     )
 
 try:
@@ -38,6 +39,10 @@ try:
 except ImportError:
     from logging_config import get_logger
 
+# J2000.0 obliquity of the ecliptic (ModelSettings.obliquity_j2000 default)
+_SIN_OBL_J2000 = math.sin(math.radians(23.4392911))
+_COS_OBL_J2000 = math.cos(math.radians(23.4392911))
+
 # simple in-process cache to avoid repeated geocoding of same string
 _GEOCODE_CACHE: dict[str, Optional[GeoLocation]] = {}
 logger = get_logger(__name__)
@@ -109,23 +114,12 @@ def compute_vernal_equinox_offset(year: int, eph, observer, ts) -> float:
     if best_t is not None:  # Use 'is not None' to avoid Skyfield Time object truthiness issues
         astrometric_vernal = (eph["earth"] + observer).at(best_t).observe(sun).apparent()
         ra_vernal, dec_vernal, _ = astrometric_vernal.radec()
-        ra_v_deg = ra_vernal.hours * 15.0
-        ra_v_rad = math.radians(ra_v_deg)
-        dec_v_rad = math.radians(dec_vernal.degrees)
-        # Use constants (can be overridden by ModelSettings if model available)
-        obliquity_j2000_deg = 23.4392911  # Default, ModelSettings can override
-        obliquity_j2000 = math.radians(obliquity_j2000_deg)
-        sin_ra_v = math.sin(ra_v_rad)
-        cos_ra_v = math.cos(ra_v_rad)
-        tan_dec_v = math.tan(dec_v_rad)
-        sin_obl = math.sin(obliquity_j2000)
-        cos_obl = math.cos(obliquity_j2000)
-        ecl_lon_vernal_rad = math.atan2(sin_ra_v * cos_obl + tan_dec_v * sin_obl, cos_ra_v)
-        degrees_in_circle = 360.0  # Default, ModelSettings can override
-        ecl_lon_vernal_deg = math.degrees(ecl_lon_vernal_rad) % degrees_in_circle
-        if ecl_lon_vernal_deg < 0:
-            ecl_lon_vernal_deg += degrees_in_circle
-        return ecl_lon_vernal_deg
+        ra_v_rad = math.radians(ra_vernal.hours * 15.0)
+        tan_dec_v = math.tan(math.radians(dec_vernal.degrees))
+        # J2000 obliquity and full circle (ModelSettings defaults); float % with a
+        # positive divisor is already non-negative, so no extra wrap is needed
+        return (math.degrees(math.atan2(math.sin(ra_v_rad) * _COS_OBL_J2000 + tan_dec_v * _SIN_OBL_J2000,
+                                        math.cos(ra_v_rad))) % 360.0)
     
     # Fallback: return 0 if we couldn't find the vernal equinox
     return 0.0
@@ -137,6 +131,19 @@ class _QuickLoc:
         self.latitude = lat
         self.longitude = lon
 
+def _parse_isoformat(s: str) -> Optional[datetime]:
+    """Parse ISO 8601 text (e.g. datetime.isoformat() output) with the C fast path.
+    
+    All-digit strings are left to the compact-date and Unix-timestamp parsers.
+    """
+    if s.isdigit():
+        return None
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        return None
+
+
 def _parse_dateutil(value_to_parse: str) -> Optional[datetime]:
     """Try parsing with dateutil.parser, with dayfirst fallback for month errors.
     
@@ -263,10 +270,11 @@ def _parse_date_string(value_to_parse: str) -> datetime:
        - Compact date (YYYYMMDD)
        - Year-month (YYYY-MM) - defaults to day 1
        - Year only (YYYY) - defaults to Jan 1
-    2. dateutil.parser (with dayfirst fallback for DD.MM.YYYY)
-    3. Relative dates (today, yesterday, tomorrow)
-    4. Unix timestamp
-    5. Julian Day Number
+    2. ISO 8601 via datetime.fromisoformat (fast path for isoformat() output)
+    3. dateutil.parser (with dayfirst fallback for DD.MM.YYYY)
+    4. Relative dates (today, yesterday, tomorrow)
+    5. Unix timestamp
+    6. Julian Day Number
     
     Raises:
         ValueError: If no parser can handle the format
@@ -287,6 +295,11 @@ def _parse_date_string(value_to_parse: str) -> datetime:
         if result:
             return result
     
+    # ISO 8601 covers datetime.isoformat() round-trips far faster than dateutil
+    result = _parse_isoformat(s)
+    if result:
+        return result
+    
     # Try dateutil (handles DD.MM.YYYY with dayfirst)
     result = _parse_dateutil(s)
     if result:
@@ -618,6 +631,10 @@ def to_timezone(dt: datetime, tz_name: str) -> datetime:
 def in_range(dt: datetime, dr: DateRange) -> bool:
     """Check if datetime lies within the inclusive DateRange.
     
+    When dt and both bounds are timezone-aware, the precomputed integer UTC
+    timestamps are compared. Otherwise this is a plain ``dr.start <= dt <= dr.end``,
+    so mixing naive and aware datetimes still raises TypeError.
+    
     Args:
         dt: Datetime to check
         dr: DateRange with start and end datetimes
@@ -625,7 +642,34 @@ def in_range(dt: datetime, dr: DateRange) -> bool:
     Returns:
         True if dt is within [start, end] (inclusive), False otherwise
     """
-    return dr.start <= dt <= dr.end
+    t_ns = to_epoch_ns(dt)
+    if t_ns is None or dr.start_ns is None or dr.end_ns is None:
+        return dr.start <= dt <= dr.end
+    return dr.start_ns <= t_ns <= dr.end_ns
+
+def subjects_in_range(subjects: List[ChartSubject], dr: DateRange) -> List[ChartSubject]:
+    """Filter subjects whose event_time lies within the inclusive DateRange.
+    
+    With aware datetimes throughout, the event times are converted to int64
+    UTC timestamps and compared in a single NumPy pass; anything else goes
+    through in_range one subject at a time.
+    
+    Args:
+        subjects: Subjects to filter (entries without a datetime are skipped)
+        dr: DateRange with start and end datetimes
+        
+    Returns:
+        Subjects within [start, end], in their original order
+    """
+    candidates = [s for s in subjects if isinstance(getattr(s, 'event_time', None), datetime)]
+    if not candidates:
+        return []
+    stamps = [to_epoch_ns(s.event_time) for s in candidates]
+    if dr.start_ns is None or dr.end_ns is None or None in stamps:
+        return [s for s in candidates if in_range(s.event_time, dr)]
+    times = np.array(stamps, dtype=np.int64)
+    mask = (times >= dr.start_ns) & (times <= dr.end_ns)
+    return [s for s, keep in zip(candidates, mask) if keep]
 
 def expand_range(center: datetime, days: int) -> DateRange:
     """Create a DateRange centered on a datetime extending days on both sides.
@@ -853,12 +897,12 @@ def _to_primitive(obj: Any) -> Any:
         Primitive representation suitable for YAML/JSON serialization
     """
     if is_dataclass(obj):
-        obj = asdict(obj)
+        return {f.name: _to_primitive(getattr(obj, f.name)) for f in fields(obj)}
     if isinstance(obj, Enum):
         return obj.value
     if isinstance(obj, (datetime, date, time)):
         return obj.isoformat()
-    if isinstance(obj, dict):
+    if isinstance(obj, Mapping):
         return {k: _to_primitive(v) for k, v in obj.items()}
     if isinstance(obj, (list, tuple, set)):
         return [_to_primitive(v) for v in obj]
@@ -1046,6 +1090,9 @@ def export_workspace_yaml(ws: Workspace, dest_path: Union[str, Path]) -> Path:
 # Note: Workspace-related functions (validate_workspace, build_workspace_from_sfs, etc.)
 # have been moved to workspace.py for better module organization
 
+_MISSING = object()
+
+
 def _safe_get_attr(obj: Any, attr: str, default: Any = None) -> Any:
     """Safely get an attribute from an object or dict.
     
@@ -1062,12 +1109,15 @@ def _safe_get_attr(obj: Any, attr: str, default: Any = None) -> Any:
     if obj is None:
         return default
     try:
-        if hasattr(obj, attr):
-            return getattr(obj, attr)
-        if isinstance(obj, dict):
-            return obj.get(attr, default)
+        # Single lookup; a missing attribute yields the sentinel without raising
+        value = getattr(obj, attr, _MISSING)
     except Exception:
-        pass
+        # Properties may raise something other than AttributeError
+        return default
+    if value is not _MISSING:
+        return value
+    if isinstance(obj, dict):
+        return obj.get(attr, default)
     return default
 
 
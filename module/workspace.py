@@ -1,7 +1,7 @@
 from pathlib import Path
 from datetime import datetime, date, time
 from typing import Union, Optional, List, Dict, Iterator, Callable, Tuple, Any
-from dataclasses import asdict, is_dataclass
+from dataclasses import is_dataclass
 try:
     from module.models import (
         Workspace, ChartPreset, ChartSubject,
@@ -97,7 +97,7 @@ def save_workspace_flat(workspace: Workspace, path: str, format: str = "yaml") -
     Raises:
         ValueError: If format is not "yaml" or "json"
     """
-    data = asdict(workspace)
+    data = _to_primitive(workspace)
 
     if format == "yaml":
         write_yaml_file(path, data, sort_keys=False, allow_unicode=True)
@@ -1,6 +1,7 @@
 import unittest
 from datetime import datetime, timedelta, timezone, UTC
-from module.utils import Actual
+from module.utils import Actual, expand_range, in_range, subjects_in_range
+from module.models import ChartSubject, DateRange
 
 
 class Context(unittest.TestCase):
@@ -25,6 +26,10 @@ class Context(unittest.TestCase):
     def test_julian_timestamp(self):
         self.assertEqual(Actual("2023-12-14").value, datetime(2023, 12, 14))
 
+    def test_isoformat_round_trip(self):
+        dt = datetime(2023, 12, 14, 10, 30, tzinfo=timezone(timedelta(hours=1)))
+        self.assertEqual(Actual(dt.isoformat()).value, dt)
+
     def test_julian_day_number(self):
         # JD2451545.0 is 2000-01-01 12:00:00 UTC
         result = Actual("JD2451545.0").value
@@ -66,5 +71,34 @@ class Context(unittest.TestCase):
     def test_year_only(self):
         self.assertEqual(Actual("2023").value, datetime(2023, 1, 1))
 
+    def test_date_range_nanosecond_bounds(self):
+        center = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        dr = expand_range(center, 1)
+        self.assertEqual(dr.start_ns, int((center - timedelta(days=1)).timestamp()) * 1_000_000_000)
+        self.assertTrue(in_range(center, dr))
+        self.assertTrue(in_range(dr.end, dr))
+        self.assertFalse(in_range(center + timedelta(days=2), dr))
+
+    def test_subjects_in_range(self):
+        center = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        inside = ChartSubject(id="a", name="a", event_time=center, location=None)
+        outside = ChartSubject(id="b", name="b", event_time=center, location=None)
+        outside.event_time = center + timedelta(days=5)
+        self.assertEqual(subjects_in_range([inside, outside], expand_range(center, 1)), [inside])
+
+    def test_in_range_naive_datetimes_keep_direct_comparison(self):
+        naive = datetime(2024, 1, 1, 12, 0)
+        self.assertTrue(in_range(naive, expand_range(naive, 1)))
+        self.assertFalse(in_range(naive + timedelta(days=2), expand_range(naive, 1)))
+        # Naive vs aware is not silently treated as UTC
+        with self.assertRaises(TypeError):
+            in_range(naive, expand_range(naive.replace(tzinfo=timezone.utc), 1))
+        subj = ChartSubject(id="a", name="a", event_time=naive, location=None)
+        self.assertEqual(subjects_in_range([subj], expand_range(naive, 1)), [subj])
+
+    def test_in_range_non_datetime_bounds(self):
+        self.assertTrue(in_range(5, DateRange(1, 10)))
+        self.assertFalse(in_range(11, DateRange(1, 10)))
+
 if __name__ == "__main__":
     unittest.main()
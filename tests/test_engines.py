@@ -25,7 +25,10 @@ try:
 except ImportError:
     KERYKEION_AVAILABLE = False
 
-from module.services import compute_jpl_positions, compute_positions
+from module.services import (
+    compute_jpl_positions, compute_positions, compute_positions_batch, compute_subject,
+    _JPL_POSITION_CACHE, _cache_time_bucket, _ecliptic_longitudes_from_icrf, _extract_kerykeion_observable_objects, _extract_positions_array,
+)
 from module.models import EngineType
 from module.utils import Actual
 
@@ -190,6 +193,84 @@ class TestJPLSkyfieldEngine(unittest.TestCase):
             self.assertGreaterEqual(lon, 0.0)
             self.assertLess(lon, 360.0)
 
+    def test_jpl_position_cache_returns_copies(self):
+        """Repeated queries are served from cache without sharing mutable results."""
+        args = ("Cache", "2024-01-01T12:00:00+00:00", "50.0755, 14.4378", self.ephemeris_path)
+        first = compute_jpl_positions(*args, requested_objects=["sun", "moon"])
+        first["sun"] = -1.0
+        second = compute_jpl_positions(*args, requested_objects=["moon", "sun"])
+        self.assertEqual(set(second), {"sun", "moon"})
+        self.assertNotEqual(second["sun"], -1.0)
+
+    def test_jpl_batch_matches_single_queries(self):
+        """Vectorised series computation agrees with per-time queries."""
+        loc = "50.0755, 14.4378"
+        times = ["2023-12-31T23:00:00+00:00", "2024-01-01T12:00:00+00:00", "2024-06-21T06:30:00+00:00"]
+        batch = compute_positions_batch(EngineType.JPL, "Batch", times, loc, self.ephemeris_path,
+                                        requested_objects=["sun", "moon", "saturn"])
+        self.assertEqual(set(batch), {"sun", "moon", "saturn"})
+        for i, dt_str in enumerate(times):
+            single = compute_jpl_positions("Batch", dt_str, loc, self.ephemeris_path,
+                                           requested_objects=["sun", "moon", "saturn"])
+            for planet, lon in single.items():
+                self.assertAlmostEqual(batch[planet][i], lon, places=6)
+
+    def test_jpl_batch_without_requested_objects_returns_planets(self):
+        """requested_objects=None yields the same planets-only set as a single JPL query."""
+        loc = "50.0755, 14.4378"
+        times = ["2024-01-01T12:00:00+00:00", "2024-01-02T12:00:00+00:00"]
+        batch = compute_positions_batch(EngineType.JPL, "Batch", times, loc, self.ephemeris_path)
+        single = compute_positions(EngineType.JPL, "Batch", times[0], loc, self.ephemeris_path)
+        self.assertTrue(batch)
+        self.assertEqual(set(batch), set(single))
+        self.assertNotIn("asc", batch)
+        for planet, column in batch.items():
+            self.assertEqual(len(column), len(times))
+            self.assertAlmostEqual(column[0], single[planet], places=6)
+
+    def test_jpl_vectorized_ecliptic_conversion(self):
+        """Batch ICRF rotation matches the scalar RA/Dec J2000 formula."""
+        import math
+        ra_hours = [0.0, 6.0, 18.75, 23.9]
+        dec_degrees = [0.0, 23.44, -23.0, 5.5]
+        offset = 0.35
+        vectors = [
+            (math.cos(math.radians(d)) * math.cos(math.radians(r * 15.0)),
+             math.cos(math.radians(d)) * math.sin(math.radians(r * 15.0)),
+             math.sin(math.radians(d)))
+            for r, d in zip(ra_hours, dec_degrees)
+        ]
+        lons = _ecliptic_longitudes_from_icrf(vectors, offset)
+        obl = math.radians(23.4392911)
+        for ra_h, dec_d, lon in zip(ra_hours, dec_degrees, lons):
+            ra, dec = math.radians(ra_h * 15.0), math.radians(dec_d)
+            expected = (math.degrees(math.atan2(math.sin(ra) * math.cos(obl) + math.tan(dec) * math.sin(obl), math.cos(ra))) - offset) % 360.0
+            self.assertAlmostEqual(lon, expected, places=9)
+            self.assertGreaterEqual(lon, 0.0)
+            self.assertLess(lon, 360.0)
+
+    def test_jpl_cached_positions_do_not_depend_on_query_order(self):
+        """Queries in one cache window all get the positions at the window start."""
+        loc = "50.0755, 14.4378"
+        start = datetime.datetime(2024, 1, 1, 12, 0, 40, tzinfo=datetime.timezone.utc)
+        results = []
+        for offset in (7, 2, 0):
+            _JPL_POSITION_CACHE.clear()
+            dt_str = (start + datetime.timedelta(seconds=offset)).isoformat()
+            results.append(compute_jpl_positions("Order", dt_str, loc, self.ephemeris_path,
+                                                 requested_objects=["sun", "mars"]))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+
+    def test_jpl_cache_time_bucket(self):
+        """Cache windows follow the fastest requested body."""
+        dt = datetime.datetime(2024, 1, 1, 12, 0, 47, tzinfo=datetime.timezone.utc)
+        base = int(dt.timestamp())
+        self.assertEqual(_cache_time_bucket(dt, ("moon", "saturn")), base)
+        self.assertEqual(_cache_time_bucket(dt, ("sun", "mars")), base - 7)
+        self.assertEqual(_cache_time_bucket(dt, ("saturn",)), base - 47)
+        self.assertEqual(_cache_time_bucket(dt, ("saturn",), topocentric=True), base)
+
     @unittest.skipUnless(SKYFIELD_AVAILABLE, "skyfield not available")
     def test_jpl_available_functions(self):
         """Report and sanity-check available Skyfield API functions."""
@@ -280,6 +361,26 @@ class TestKerykeionEngine(unittest.TestCase):
                 self.assertGreaterEqual(lon, 0.0)
                 self.assertLess(lon, 360.0)
     
+    @unittest.skipUnless(KERYKEION_AVAILABLE, "kerykeion not available")
+    def test_kerykeion_requested_subset(self):
+        """Requesting a few objects (including aliases) returns exactly those."""
+        subj = compute_subject("Subset", "2000-01-01 12:00", "50.0755, 14.4378")
+        full = _extract_kerykeion_observable_objects(subj)
+        subset = _extract_kerykeion_observable_objects(subj, ["sun", "moon", "asc", "lilith"])
+        self.assertEqual(set(subset), {"sun", "moon", "asc", "lilith"})
+        for key, lon in subset.items():
+            self.assertAlmostEqual(lon, full[key], places=9)
+        names, lons = _extract_positions_array(subj, ["sun", "moon", "asc", "lilith"])
+        self.assertEqual(lons.shape, (len(names),))
+        self.assertEqual(dict(zip(names, lons.tolist())), subset)
+    
+    @unittest.skipUnless(KERYKEION_AVAILABLE, "kerykeion not available")
+    def test_kerykeion_unsatisfiable_request_is_still_filtered(self):
+        """An id Kerykeion cannot provide does not widen the result to every planet."""
+        subj = compute_subject("Subset", "2000-01-01 12:00", "50.0755, 14.4378")
+        self.assertEqual(set(_extract_kerykeion_observable_objects(subj, ["sun"])), {"sun"})
+        self.assertEqual(set(_extract_kerykeion_observable_objects(subj, ["sun", "no_such_body"])), {"sun"})
+    
     @unittest.skipUnless(KERYKEION_AVAILABLE, "kerykeion not available")
     def test_kerykeion_known_date(self):
         """Test Kerykeion positions for a known date."""
@@ -0,0 +1,64 @@
+import unittest
+import tempfile
+from pathlib import Path
+from datetime import datetime, timezone
+
+import numpy as np
+
+from module.ephemeris_cache import LongitudeTable, load_cache
+
+
+def _table() -> LongitudeTable:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+    times = start + np.arange(3) * 600.0
+    # Moon crosses 0° between the second and third sample (stored unwrapped)
+    longitudes = np.array([[10.0, 358.0], [10.1, 359.5], [10.2, 361.0]])
+    return LongitudeTable(times, longitudes, ("sun", "moon"), 50.0875, 14.4214, "de421.bsp")
+
+
+class TestLongitudeTable(unittest.TestCase):
+    def test_lookup_interpolates_across_wrap(self):
+        table = _table()
+        dt = datetime(2024, 1, 1, 0, 15, tzinfo=timezone.utc)
+        lons = table.lookup_longitudes(dt)
+        self.assertAlmostEqual(lons["sun"], 10.15)
+        self.assertAlmostEqual(lons["moon"], 0.25)
+        self.assertEqual(set(table.lookup_longitudes(dt, ["moon", "pluto"])), {"moon"})
+
+    def test_covers(self):
+        table = _table()
+        dt = datetime(2024, 1, 1, 0, 5, tzinfo=timezone.utc)
+        self.assertTrue(table.covers(dt, 50.08751, 14.4214, "/eph/de421.bsp", ["sun"]))
+        self.assertFalse(table.covers(dt, 50.0875, 14.4214, "/eph/de421.bsp", ["mars"]))
+        self.assertFalse(table.covers(dt, 48.0, 14.4214, "/eph/de421.bsp", ["sun"]))
+        self.assertFalse(table.covers(dt, 50.0875, 14.4214, "/eph/de440s.bsp", ["sun"]))
+        late = datetime(2024, 1, 1, 1, 0, tzinfo=timezone.utc)
+        self.assertFalse(table.covers(late, 50.0875, 14.4214, "/eph/de421.bsp", ["sun"]))
+
+    def test_naive_datetimes_are_utc(self):
+        table = _table()
+        naive = datetime(2024, 1, 1, 0, 15)
+        self.assertTrue(table.covers(naive, 50.0875, 14.4214, "de421.bsp", ["sun"]))
+        self.assertEqual(table.lookup_longitudes(naive), table.lookup_longitudes(naive.replace(tzinfo=timezone.utc)))
+
+    def test_load_round_trip(self):
+        table = _table()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "table.npz"
+            np.savez_compressed(
+                path,
+                times=table.times,
+                longitudes=table.longitudes,
+                planets=np.array(table.planets),
+                location=np.array([table.latitude, table.longitude]),
+                ephemeris=np.array(table.ephemeris),
+            )
+            loaded = load_cache(path)
+        self.assertEqual(loaded.planets, ("sun", "moon"))
+        self.assertEqual((loaded.latitude, loaded.longitude), (50.0875, 14.4214))
+        self.assertEqual(loaded.ephemeris, "de421.bsp")
+        np.testing.assert_array_equal(loaded.longitudes, table.longitudes)
+
+
+if __name__ == "__main__":
+    unittest.main()
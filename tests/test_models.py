@@ -0,0 +1,47 @@
+import copy
+import pickle
+import unittest
+from types import MappingProxyType
+
+from module.models import (
+    AspectDefinition, ChartConfig, ChartMode, HouseSystem, OverrideEntry, ZodiacType,
+)
+
+
+class TestSharedMappings(unittest.TestCase):
+    def _aspect(self) -> AspectDefinition:
+        return AspectDefinition(id="trine", glyph="t", angle=120.0, default_orb=6.0, i18n={"en": "Trine"})
+
+    def test_definition_i18n_is_read_only(self):
+        asp = self._aspect()
+        self.assertIsInstance(asp.i18n, MappingProxyType)
+        with self.assertRaises(TypeError):
+            asp.i18n["en"] = "Triangle"
+        # An existing proxy is shared, not copied
+        other = AspectDefinition(id="trine2", glyph="t", angle=120.0, default_orb=6.0, i18n=asp.i18n)
+        self.assertIs(other.i18n, asp.i18n)
+
+    def test_definitions_deepcopy_and_pickle(self):
+        asp = self._aspect()
+        entry = OverrideEntry(id="trine", i18n={"cs": "Trigon"})
+        for obj in (asp, entry):
+            for clone in (copy.deepcopy(obj), pickle.loads(pickle.dumps(obj))):
+                self.assertEqual(clone, obj)
+                self.assertIsInstance(clone.i18n, MappingProxyType)
+
+    def test_mappingproxy_pickling_is_not_changed_globally(self):
+        with self.assertRaises(TypeError):
+            pickle.dumps(MappingProxyType({"a": 1}))
+
+    def test_chart_config_aspect_orbs_stay_editable(self):
+        cfg = ChartConfig(
+            mode=ChartMode.NATAL, house_system=HouseSystem.PLACIDUS, zodiac_type=ZodiacType.TROPICAL,
+            included_points=[], aspect_orbs={"conjunction": 8.0}, display_style="", color_theme="",
+        )
+        cfg.aspect_orbs["conjunction"] = 5.0
+        self.assertEqual(cfg.aspect_orbs, {"conjunction": 5.0})
+        self.assertEqual(copy.deepcopy(cfg).aspect_orbs, {"conjunction": 5.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
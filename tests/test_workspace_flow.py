@@ -1,13 +1,21 @@
 import unittest
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from datetime import datetime
 import yaml
 import pytz
 
 from module.workspace import init_workspace, load_workspace, save_workspace_modular, add_chart
 from module.utils import prepare_horoscope
-from module.models import Location, EngineType, HouseSystem, ZodiacType
+from module.models import (
+    Location, EngineType, HouseSystem, ZodiacType,
+    AstroModel, AspectDefinition, BodyDefinition, ModelSettings, ModelOverrides, OverrideEntry,
+)
+from module.services import (
+    merge_model_with_overrides, _get_effective_model, find_chart_by_name_or_id, resolve_effective_defaults,
+    list_open_view_rows, search_charts, OpenViewRow,
+)
 
 
 def _make_sample_location() -> Location:
@@ -103,6 +111,108 @@ class TestWorkspaceFlow(unittest.TestCase):
             self.assertEqual(len(ws_ref.charts), 1)
             self.assertEqual(ws_ref.charts[0].subject.name, "Sample A")
 
+    def test_find_chart_by_name_or_id_follows_changes(self):
+        def chart(chart_id, name):
+            return SimpleNamespace(id=chart_id, subject=SimpleNamespace(name=name, event_time=None, location=None))
+
+        a, b = chart("a", "Alice"), chart("b", "Bob")
+        ws = SimpleNamespace(charts=[a, b])
+        self.assertIs(find_chart_by_name_or_id(ws, "Bob"), b)
+        self.assertIs(find_chart_by_name_or_id(ws, " a "), a)
+        # Charts added, renamed or removed in place are still found correctly
+        c = chart("c", "Carol")
+        ws.charts.append(c)
+        self.assertIs(find_chart_by_name_or_id(ws, "Carol"), c)
+        b.subject.name = "Robert"
+        self.assertIsNone(find_chart_by_name_or_id(ws, "Bob"))
+        self.assertIs(find_chart_by_name_or_id(ws, "Robert"), b)
+        ws.charts.remove(a)
+        self.assertIsNone(find_chart_by_name_or_id(ws, "Alice"))
+        self.assertIs(find_chart_by_name_or_id(ws, "c"), c)
+
+    def test_open_view_rows_and_search_share_chart_view(self):
+        loc = SimpleNamespace(name="Prague, CZ")
+        subj = SimpleNamespace(name="Alice", event_time="2024-01-01 12:00", location=loc)
+        ch = SimpleNamespace(id="a", subject=subj, config=SimpleNamespace(mode=None), tags=["natal"])
+        ws = SimpleNamespace(charts=[ch])
+        row = list_open_view_rows(ws)[0]
+        self.assertEqual((row.name, row.location, row.tags), ("Alice", "Prague, CZ", "natal"))
+        self.assertEqual(row.search_text, "alice  2024-01-01 12:00 prague, cz natal")
+        self.assertEqual(row._asdict()["name"], "Alice")
+        self.assertEqual(OpenViewRow.from_fields(*row[:5]), row)
+        self.assertEqual(search_charts(ws, "PRAGUE"), [ch])
+        # Tag edits refresh both the row and the search haystack
+        ch.tags = ["natal", "family"]
+        self.assertEqual(list_open_view_rows(ws)[0].tags, "natal, family")
+        self.assertEqual(search_charts(ws, "family"), [ch])
+
+
+class TestModelOverrides(unittest.TestCase):
+    def _model(self) -> AstroModel:
+        return AstroModel(
+            name="test",
+            body_definitions=[
+                BodyDefinition(id="sun", glyph="S", formula="sun", element=None, avg_speed=1.0, max_orb=10.0, i18n={}),
+                BodyDefinition(id="moon", glyph="M", formula="moon", element=None, avg_speed=13.0, max_orb=10.0, i18n={}),
+            ],
+            aspect_definitions=[
+                AspectDefinition(id="conjunction", glyph="c", angle=0.0, default_orb=8.0, i18n={}, color="red"),
+                AspectDefinition(id="opposition", glyph="o", angle=180.0, default_orb=8.0, i18n={}),
+            ],
+            signs=[],
+            settings=ModelSettings(
+                default_house_system=HouseSystem.PLACIDUS,
+                default_aspects=["conjunction"],
+                default_bodies=["sun"],
+                standard_orb=5.0,
+            ),
+        )
+
+    def test_merge_model_with_overrides(self):
+        model = self._model()
+        overrides = ModelOverrides(
+            aspects=[OverrideEntry(id="conjunction", glyph="C", default_orb=3.0)],
+            points=[OverrideEntry(id="sun", glyph="☉")],
+            override_orbs={"opposition": 2},
+        )
+        merged = merge_model_with_overrides(model, overrides)
+        conj, opp = merged.aspect_definitions
+        self.assertEqual((conj.glyph, conj.default_orb, conj.color), ("C", 3.0, "red"))
+        self.assertEqual(opp.default_orb, 2.0)
+        self.assertEqual([b.glyph for b in merged.body_definitions], ["☉", "M"])
+        # Base model untouched; unchanged definitions shared
+        self.assertEqual(model.aspect_definitions[0].default_orb, 8.0)
+        self.assertIs(merged.body_definitions[1], model.body_definitions[1])
+        self.assertIsNot(merged.settings, model.settings)
+
+    def test_merge_model_with_empty_overrides_returns_model(self):
+        model = self._model()
+        self.assertIs(merge_model_with_overrides(model, ModelOverrides()), model)
+
+    def test_effective_defaults_results_can_be_mutated(self):
+        model = self._model()
+        ws = SimpleNamespace(default=SimpleNamespace(observable_objects=["asc"]), aspects=[])
+        first = resolve_effective_defaults(ws, model)
+        self.assertEqual(first["observable_objects"], ["sun", "asc"])
+        first["observable_objects"].append("pluto")
+        first["bodies"].append("pluto")
+        again = resolve_effective_defaults(ws, model)
+        self.assertEqual(again["observable_objects"], ["sun", "asc"])
+        self.assertEqual(again["bodies"], ["sun"])
+        self.assertEqual(model.settings.default_bodies, ["sun"])
+
+    def test_effective_model_reused_until_overrides_change(self):
+        model = self._model()
+        overrides = ModelOverrides(override_orbs={"opposition": 2})
+        ws = SimpleNamespace(models={"test": model}, active_model="test", model_overrides=overrides)
+        first = _get_effective_model(ws)
+        self.assertIs(_get_effective_model(ws), first)
+        self.assertEqual(first.aspect_definitions[1].default_orb, 2.0)
+        overrides.override_orbs["opposition"] = 4
+        second = _get_effective_model(ws)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.aspect_definitions[1].default_orb, 4.0)
+
 
 if __name__ == "__main__":
     unittest.main()